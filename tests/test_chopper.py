@@ -37,6 +37,12 @@ def test_crun_frames_within_run_duration(chopper_run):
     assert np.all(times < stop_max)
 
 
+@pytest.mark.rootfile
+def test_crun_frames_sorted(chopper_run):
+    times = chopper_run.cycle_param.frame_start_times
+    assert np.all(np.diff(times) >= 0)
+
+
 @pytest.mark.rootfile
 def test_crun_chop_time_ch_default(chopper_run):
     assert chopper_run.chop_time_ch == 15
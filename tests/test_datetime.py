@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from ucndata.datetime import to_datetime, from_datetime
+from ucndata.datetime import to_datetime, from_datetime, _epoch_to_datetime
 
 
 T0 = 1717243200   # 2024-06-01 12:00:00 UTC, same as root builder
@@ -114,3 +114,21 @@ def test_empty_array():
     arr    = np.array([], dtype=np.int64)
     result = to_datetime(arr)
     assert len(result) == 0
+
+
+# ---------------------------------------------------------------------------
+# _epoch_to_datetime
+# ---------------------------------------------------------------------------
+
+def test_epoch_to_datetime_matches_float_conversion():
+    """Integer-nanosecond path agrees with pd.to_datetime(unit='s') within 1 us."""
+    t = T0 + np.array([0.0, 0.05, 19.95, 120.5])
+    result = _epoch_to_datetime(t)
+    expected = pd.to_datetime(t, unit='s')
+    diff = (result - expected).to_numpy().astype(np.int64)
+    assert np.all(np.abs(diff) < 1000)
+
+
+def test_epoch_to_datetime_keeps_index_name():
+    idx = pd.Index(T0 + np.array([0.0, 1.5]), name="timestamp")
+    assert _epoch_to_datetime(idx).name == "timestamp"
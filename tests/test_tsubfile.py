@@ -116,6 +116,19 @@ def test_tsubfile_out_of_range_no_error(good_run):
     assert tree is not None
 
 
+@pytest.mark.rootfile
+@pytest.mark.parametrize("sort", [True, False])
+def test_tsubfile_time_indexed_df_inclusive_bounds(good_run, sort):
+    """Time-indexed DataFrame keeps rows in [start, stop], sorted or not."""
+    t = T0 + np.arange(0, 100, 5.0)
+    if not sort:
+        t = t[::-1]
+    good_run.tfile["TimeFrame"] = pd.DataFrame({"x": np.arange(len(t))},
+                                               index=pd.Index(t, name="timestamp"))
+    df = tsubfile(good_run.tfile, T0 + 10, T0 + 20)["TimeFrame"]
+    assert sorted(df.index - T0) == [10, 15, 20]
+
+
 @pytest.mark.rootfile
 def test_tsubfile_non_time_indexed_df_unfiltered(good_run):
     """A DataFrame whose index name lacks 'time' is returned unfiltered."""
@@ -4,6 +4,7 @@ ucnbase is abstract; all tests run through ucnrun or ucncycle.
 """
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from ucndata.applylist import applylist
@@ -30,6 +31,55 @@ def test_apply_correct_values(good_run):
     assert list(result) == [0, 1, 2]
 
 
+# ---------------------------------------------------------------------------
+# batch_apply()
+# ---------------------------------------------------------------------------
+
+@pytest.mark.rootfile
+def test_batch_apply_returns_applylist(good_run):
+    result = good_run.batch_apply("UCNHits_He3", "tIsUCN", reduce="count")
+    assert isinstance(result, applylist)
+    assert len(result) == 3
+
+
+@pytest.mark.rootfile
+def test_batch_apply_sum_matches_count(good_run):
+    """ucn_only filter keeps tIsUCN == 1, so the sum equals the count."""
+    counts = good_run.batch_apply("UCNHits_He3", "tIsUCN", reduce="count")
+    sums = good_run.batch_apply("UCNHits_He3", "tIsUCN", reduce="sum")
+    assert list(sums) == list(counts)
+    assert sum(counts) <= len(good_run.get_hits_array("He3"))
+
+
+@pytest.mark.rootfile
+def test_batch_apply_cycle_level_is_scalar(good_run):
+    result = good_run[1].batch_apply("UCNHits_He3", "tIsUCN", reduce="count")
+    assert result == good_run.batch_apply("UCNHits_He3", "tIsUCN", reduce="count")[1]
+
+
+@pytest.mark.rootfile
+def test_batch_apply_period_level_uses_period_window(good_run):
+    period = good_run[0, 1]
+    result = period.batch_apply("UCNHits_He3", "tIsUCN", reduce="count")
+    t = good_run.get_hits_array("He3")
+    expected = np.count_nonzero((t >= period.period_start) & (t <= period.period_stop))
+    assert result == expected
+    assert result < good_run[0].batch_apply("UCNHits_He3", "tIsUCN", reduce="count")
+
+
+@pytest.mark.rootfile
+def test_batch_apply_respects_filter(good_run):
+    good_run.set_cycle_filter([True, False, True])
+    result = good_run.batch_apply("UCNHits_He3", "tIsUCN", reduce="max")
+    assert len(result) == 2
+
+
+@pytest.mark.rootfile
+def test_batch_apply_bad_reduce_raises(good_run):
+    with pytest.raises(RuntimeError):
+        good_run.batch_apply("UCNHits_He3", "tIsUCN", reduce="median")
+
+
 # ---------------------------------------------------------------------------
 # get_hits_array
 # ---------------------------------------------------------------------------
@@ -48,6 +98,27 @@ def test_get_hits_array_li6_returns_array(good_run):
     assert len(arr) > 0
 
 
+@pytest.mark.rootfile
+def test_get_hits_array_disk_cache(good_run, tmp_path, monkeypatch):
+    import ucndata
+    monkeypatch.setattr(ucndata, "CACHEDIR", str(tmp_path))
+    arr = good_run.get_hits_array("He3")
+    files = list(tmp_path.glob("*.npy"))
+    assert len(files) == 1
+    assert np.array_equal(good_run.get_hits_array("He3"), arr)
+    assert np.array_equal(np.load(files[0]), arr)
+
+
+@pytest.mark.rootfile
+def test_get_hits_array_period_slices_run(good_run):
+    period = good_run[0, 1]
+    arr = period.get_hits_array("He3")
+    run_arr = good_run.get_hits_array("He3")
+    inside = (run_arr >= period.period_start) & (run_arr < period.period_stop)
+    assert np.array_equal(arr, np.sort(run_arr[inside]))
+    assert len(arr) > 0
+
+
 @pytest.mark.rootfile
 def test_get_hits_array_unknown_detector_raises(good_run):
     with pytest.raises(KeyError):
@@ -93,6 +164,13 @@ def test_get_hits_histogram_unknown_detector_raises(good_run):
         good_run.get_hits_histogram("UnknownXYZ")
 
 
+@pytest.mark.rootfile
+@pytest.mark.parametrize("bin_ms", [0, 0.0004])
+def test_get_hits_histogram_sub_us_bin_raises(good_run, bin_ms):
+    with pytest.raises(ValueError):
+        good_run.get_hits_histogram("He3", bin_ms=bin_ms)
+
+
 @pytest.mark.rootfile
 def test_get_hits_histogram_on_cycle_trims(good_run):
     """Histogram on a cycle is trimmed to the cycle time window."""
@@ -105,6 +183,21 @@ def test_get_hits_histogram_on_cycle_trims(good_run):
         assert np.all(hist.x < T0 + 100)
 
 
+@pytest.mark.rootfile
+def test_get_hits_histogram_counts_all_hits(good_run):
+    hist = good_run.get_hits_histogram("He3", bin_ms=10)
+    assert hist.sum == len(good_run.get_hits_array("He3"))
+
+
+@pytest.mark.rootfile
+def test_get_hits_histogram_caches_int_times(good_run):
+    good_run[0].get_hits_histogram("He3", bin_ms=1000)
+    times_us = good_run._hits_us["He3"]
+    assert times_us.dtype == np.int64
+    assert len(times_us) == len(good_run.get_hits_array("He3"))
+    np.testing.assert_array_equal(times_us, np.rint(good_run._hits_sorted["He3"] * 1e6))
+
+
 # ---------------------------------------------------------------------------
 # beam current properties
 # ---------------------------------------------------------------------------
@@ -130,10 +223,45 @@ def test_beam1a_positive(good_run):
     assert (current.values > 0).all()
 
 
+@pytest.mark.rootfile
+def test_beam1a_current_cycle_within_window(good_run):
+    cycle = good_run[0]
+    current = cycle.beam1a_current_uA
+    start = cycle.cycle_start
+    stop = cycle.cycle_stop
+    assert (current.index >= start).all()
+    assert (current.index < stop).all()
+    assert "BeamlineEpics" in good_run._epics_cache.keys()
+
+
+@pytest.mark.rootfile
+def test_load_epics_shared_by_run_and_cycles(good_run):
+    df = good_run[0]._load_epics()
+    assert df is good_run._epics_cache["BeamlineEpics"]
+    assert good_run._load_epics() is df
+    assert good_run[0]._epics_df.index.isin(df.index).all()
+
+
 # ---------------------------------------------------------------------------
 # beam_on_s / beam_off_s
 # ---------------------------------------------------------------------------
 
+@pytest.mark.rootfile
+def test_beam_durations_matches_on_off(good_run):
+    durations = good_run.beam_durations()
+    assert list(durations.columns) == ["on", "off"]
+    assert np.allclose(durations["on"].values, good_run.beam_on_s.values)
+    assert np.allclose(durations["off"].values, good_run.beam_off_s.values)
+
+
+@pytest.mark.rootfile
+def test_beam_durations_cycle_level(good_run):
+    cycle = good_run[0]
+    durations = cycle.beam_durations()
+    assert len(durations) == 1
+    assert durations["on"].iloc[0] == cycle.beam_on_s
+
+
 @pytest.mark.rootfile
 def test_beam_on_s_run_level(good_run):
     result = good_run.beam_on_s
@@ -154,6 +282,41 @@ def test_beam_off_s_cycle_level(good_run):
     assert result >= 0
 
 
+def test_nearest_mul_matches_argmin():
+    from ucndata.ucnbase import _nearest_mul
+    rng = np.random.default_rng(0)
+    times = rng.permutation(np.arange(0, 100, 5)).astype(float)
+    values = rng.normal(size=len(times))
+    targets = np.array([-3.0, 0.0, 12.4, 12.6, 47.0, 99.0, 200.0])
+    expected = [values[np.argmin(np.abs(times - t))]*2 for t in targets]
+    assert np.allclose(_nearest_mul(times, targets, values, 2), expected)
+
+
+@pytest.mark.parametrize("xmode, expected", [
+    ("datetime", "datetime"),
+    ("dur", "duration"),
+    ("duration", "duration"),
+    ("duration_c", "duration_cycle"),
+    ("", None),
+    ("time", None),
+])
+def test_get_xmode(xmode, expected):
+    from ucndata.ucnbase import _get_xmode
+    modes = ('datetime', 'duration', 'duration_run', 'duration_cycle', 'epoch')
+    assert _get_xmode(xmode, modes) == expected
+
+
+def test_sorted_by_index():
+    from ucndata.ucnbase import _sorted_by_index
+    ordered = pd.Series([1., 2., 3.], index=[10., 20., 30.])
+    assert _sorted_by_index(ordered) is ordered
+
+    shuffled = pd.Series([2., 1., 3.], index=[20., 10., 30.])
+    result = _sorted_by_index(shuffled)
+    assert list(result.index) == [10., 20., 30.]
+    assert list(result) == [1., 2., 3.]
+
+
 # ---------------------------------------------------------------------------
 # trigger_edge
 # ---------------------------------------------------------------------------
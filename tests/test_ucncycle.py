@@ -59,6 +59,13 @@ def test_period_durations_trimmed_to_cycle(good_run):
     assert len(durs) == 3
 
 
+@pytest.mark.rootfile
+def test_cycle_param_copied_caches_shared(good_run):
+    cycle = good_run[0]
+    assert cycle.cycle_param is not good_run.cycle_param
+    assert cycle._hits_us is good_run._hits_us
+
+
 @pytest.mark.rootfile
 def test_tfile_is_tsubfile(good_run):
     assert isinstance(good_run[0].tfile, tsubfile)
@@ -100,12 +107,27 @@ def test_getitem_slice_returns_applylist(good_run):
     assert len(result) == 3
 
 
+@pytest.mark.rootfile
+def test_getitem_slice_builds_only_requested(good_run):
+    cycle = good_run[0]
+    result = cycle[1:2]
+    assert [p.period for p in result] == [1]
+    assert list(cycle._perioddict.keys()) == [1]
+
+
 @pytest.mark.rootfile
 def test_getitem_out_of_bounds_raises(good_run):
     with pytest.raises(IndexError):
         _ = good_run[0][999]
 
 
+@pytest.mark.rootfile
+def test_getitem_nperiods_raises(good_run):
+    cycle = good_run[0]
+    with pytest.raises(IndexError):
+        _ = cycle[len(cycle)]
+
+
 @pytest.mark.rootfile
 def test_get_period_caches(good_run):
     cycle = good_run[0]
@@ -204,6 +226,18 @@ def test_draw_cycle_times_xmode_duration_cycle(good_run):
     plt.close("all")
 
 
+@pytest.mark.plotting
+@pytest.mark.rootfile
+def test_draw_cycle_times_multiple_axes(good_run):
+    import matplotlib.pyplot as plt
+    _, axes = plt.subplots(nrows=2, sharex=True)
+    single = good_run[0].draw_cycle_times(ax=axes[0], xmode="epoch")
+    both   = good_run[0].draw_cycle_times(ax=axes, xmode="epoch")
+    np.testing.assert_array_equal(single, both)
+    assert len(axes[0].lines) == 2 * len(axes[1].lines)
+    plt.close("all")
+
+
 @pytest.mark.plotting
 @pytest.mark.rootfile
 def test_draw_cycle_times_bad_xmode_raises(good_run):
@@ -3,6 +3,7 @@
 import numpy as np
 import pytest
 
+import ucndata
 from ucndata.ucnperiod import ucnperiod
 from ucndata.tsubfile import tsubfile
 from ucndata.ttreeslow import ttreeslow
@@ -76,6 +77,25 @@ def test_period2_dur(good_run):
     assert good_run[0, 2].period_dur == pytest.approx(50, abs=1)
 
 
+@pytest.mark.rootfile
+def test_cycle_param_shallow_copy(good_run):
+    cycle = good_run[0]
+    period = cycle[1]
+    assert period.cycle_param is not cycle.cycle_param
+    assert period.cycle_param.cycle_times is cycle.cycle_param.cycle_times
+    assert not np.isscalar(cycle.cycle_param.period_end_times)
+
+
+@pytest.mark.rootfile
+def test_cycle_param_period_scalars(good_run):
+    cycle = good_run[0]
+    period = cycle[1]
+    assert period.cycle_param.period_durations_s is cycle.cycle_param.period_durations_s
+    assert period.cycle_param.period_end_times is cycle.cycle_param.period_end_times
+    assert period.cycle_param.period_duration_s == pytest.approx(period.period_dur)
+    assert period.cycle_param.period_end_time == pytest.approx(period.period_stop)
+
+
 @pytest.mark.rootfile
 def test_tfile_is_tsubfile(good_run):
     assert isinstance(good_run[0, 0].tfile, tsubfile)
@@ -188,3 +208,39 @@ def test_is_pileup_false_on_clean_data(good_run):
 def test_is_pileup_returns_bool(good_run):
     result = good_run[1, 0].is_pileup("He3")
     assert isinstance(result, (bool, np.bool_))
+
+
+@pytest.mark.rootfile
+def test_is_pileup_true_below_threshold(good_run, monkeypatch):
+    """Any hit in the first second exceeds a threshold of zero counts/ms."""
+    monkeypatch.setitem(ucndata.DATA_CHECK_THRESH, "pileup_cnt_per_ms", 0)
+    assert good_run[0, 0].is_pileup("Li6") is True
+
+
+@pytest.mark.rootfile
+def test_is_pileup_counts_hit_at_window_edge(good_run, monkeypatch):
+    """A hit exactly at t0 + pileup_within_first_s counts in the last bin, as with np.histogram."""
+    monkeypatch.setitem(ucndata.DATA_CHECK_THRESH, "pileup_cnt_per_ms", 2)
+    monkeypatch.setitem(ucndata.DATA_CHECK_THRESH, "pileup_within_first_s", 1)
+    period = good_run[0, 0]
+    t0 = period.period_start
+    t = np.array([t0, t0 + 0.9995, t0 + 0.9995, t0 + 1.0])
+    monkeypatch.setattr(period, "get_hits_array", lambda detector: t)
+
+    counts, _ = np.histogram(t, bins=1000, range=(t0, t0 + 1))
+    assert counts[-1] == 3
+    assert period.is_pileup("Li6") is True
+
+
+@pytest.mark.rootfile
+def test_are_pileup_matches_is_pileup(good_run):
+    period = good_run[0, 0]
+    result = period.are_pileup()
+    assert set(result) == set(ucndata.DET_NAMES)
+    for det, val in result.items():
+        assert val == period.is_pileup(det)
+
+
+@pytest.mark.rootfile
+def test_are_pileup_subset(good_run):
+    assert list(good_run[0, 0].are_pileup(['Li6'])) == ['Li6']
@@ -61,8 +61,13 @@ def test_run_points_to_self(good_run):
 @pytest.mark.rootfile
 def test_caches_initialized(good_run):
     assert isinstance(good_run._cycledict, dict)
+    assert good_run._all_cycles is None
+    assert isinstance(good_run._epics_cache, dict)
     assert isinstance(good_run._hits_hist, dict)
+    assert isinstance(good_run._hits_sorted, dict)
+    assert isinstance(good_run._hits_us, dict)
     assert isinstance(good_run._nhits, dict)
+    assert isinstance(good_run._tree_df, dict)
 
 
 def test_none_returns_bare_object():
@@ -135,6 +140,14 @@ def test_set_cycle_times_crude_is_precise_timing_false(good_run):
     assert good_run.cycle_param.is_precise_timing is False
 
 
+@pytest.mark.rootfile
+def test_set_cycle_times_crude_reuses_cycle_param_tree(good_run):
+    """CycleParamTree is converted once and reused by later cycle-time calls."""
+    df = good_run._tree_df[('CycleParamTree', None)]
+    good_run.set_cycle_times_crude()
+    assert good_run._tree_df[('CycleParamTree', None)] is df
+
+
 @pytest.mark.rootfile
 def test_set_cycle_times_crude_no_sequencer_raises(no_slow_trees_file):
     """Missing SequencerTree raises DataError during run construction."""
@@ -356,6 +369,20 @@ def test_getitem_slice_returns_applylist(good_run):
     assert len(result) == 2
 
 
+@pytest.mark.rootfile
+def test_getitem_slice_builds_only_requested(good_run):
+    result = good_run[1:2]
+    assert [c.cycle for c in result] == [1]
+    assert list(good_run._cycledict.keys()) == [1]
+
+
+@pytest.mark.rootfile
+def test_getitem_slice_applies_filter(good_run):
+    good_run.set_cycle_filter([True, False, True])
+    assert [c.cycle for c in good_run[:]] == [0, 2]
+    assert [c.cycle for c in good_run[[1, 2]]] == [2]
+
+
 @pytest.mark.rootfile
 def test_getitem_all_cycles(good_run):
     result = good_run[:]
@@ -391,6 +418,18 @@ def test_iteration_yields_all_cycles(good_run):
     assert all(isinstance(c, ucncycle) for c in cycles)
 
 
+@pytest.mark.rootfile
+def test_iteration_skips_filtered_cycles(good_run):
+    good_run.set_cycle_filter([False, True, False])
+    assert [c.cycle for c in good_run] == [1]
+
+
+@pytest.mark.rootfile
+def test_iteration_all_filtered_is_empty(good_run):
+    good_run.set_cycle_filter([False, False, False])
+    assert list(good_run) == []
+
+
 @pytest.mark.rootfile
 def test_repr_nonempty(good_run):
     r = repr(good_run)
@@ -426,6 +465,24 @@ def test_get_cycle_all_returns_applylist(good_run):
     assert len(all_c) == 3
 
 
+@pytest.mark.rootfile
+def test_get_cycle_all_reuses_cycles(good_run):
+    all_c = good_run.get_cycle()
+    all_c.pop()
+    again = good_run.get_cycle()
+    assert len(again) == 3
+    assert all(c1 is c2 for c1, c2 in zip(all_c, again))
+
+
+@pytest.mark.rootfile
+def test_get_cycle_all_reset_by_modify_ptiming(good_run):
+    first = good_run.get_cycle()
+    good_run._modify_ptiming(0, 1, dt_start_s=1)
+    again = good_run.get_cycle()
+    assert again[0] is not first[0]
+    assert again[1] is first[1]
+
+
 # ---------------------------------------------------------------------------
 # set_cycle_filter / gen_cycle_filter
 # ---------------------------------------------------------------------------
@@ -475,16 +532,12 @@ def test_gen_cycle_filter_returns_bool_array(good_run):
 
 @pytest.mark.rootfile
 def test_check_data_good_file_returns_true(good_run):
-    # ucnrun.check_data calls .tIsUCN.any() on a ttree object; ttree has no
-    # .any() → AttributeError. Known issue: should call .to_array().any()
-    with pytest.raises(AttributeError):
-        good_run.check_data()
+    assert good_run.check_data() is True
 
 
 @pytest.mark.rootfile
 def test_check_data_raise_error_true_good_file(good_run):
-    with pytest.raises(AttributeError):
-        good_run.check_data(raise_error=True)
+    assert good_run.check_data(raise_error=True) is True
 
 
 # ---------------------------------------------------------------------------
@@ -554,6 +607,26 @@ def test_get_nhits_bin_ms_regenerates_cache(good_run):
     assert good_run._nhits["He3"][0] == 500
 
 
+@pytest.mark.rootfile
+def test_get_nhits_keeps_hist_per_bin_ms(good_run):
+    """Binned hit histograms are kept for each resolution, not replaced."""
+    _ = good_run._get_nhits("He3", cycle=0, bin_ms=100)
+    hist = good_run._hits_hist[("He3", 100)]
+    _ = good_run._get_nhits("He3", cycle=0, bin_ms=500)
+    _ = good_run._get_nhits("He3", cycle=0, bin_ms=100)
+    assert ("He3", 500) in good_run._hits_hist
+    assert good_run._hits_hist[("He3", 100)] is hist
+
+
+@pytest.mark.rootfile
+def test_get_nhits_cache_per_cycle_period(good_run):
+    """Cached hits are [cycle, period] with one extra column after the last period."""
+    _ = good_run._get_nhits("He3", cycle=0)
+    _, nhits, cycle_sums = good_run._nhits["He3"]
+    assert nhits.shape == (3, 4)
+    np.testing.assert_array_equal(cycle_sums, nhits.sum(axis=1))
+
+
 # ---------------------------------------------------------------------------
 # _modify_ptiming
 # ---------------------------------------------------------------------------
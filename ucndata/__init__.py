@@ -14,6 +14,10 @@ from .datetime import to_datetime, from_datetime
 # path to the directory which contains the root files
 DATADIR = "/data3/ucn/root_files"
 
+# path to a directory in which to cache hit times read from the root files,
+# for faster reloading of runs. If None, don't cache
+CACHEDIR = None
+
 # detector tree names
 DET_NAMES = {'He3':{'hits':         'UCNHits_He3',
                     'hits_orig':    'UCNHits_He3', # as saved in the root file
@@ -6,9 +6,10 @@
 # Jan 2025
 
 import ucndata
-import os
+from .ucnbase import _get_xmode
+from .datetime import _epoch_to_datetime
+from rootloader import attrdict
 import numpy as np
-import pandas as pd
 
 class crun(ucndata.ucnrun):
     def __init__(self, run, ucn_only=True, chop_time_ch=15):
@@ -26,19 +27,20 @@ class crun(ucndata.ucnrun):
                 opening times. Defaults to 15.
 
         Notes:
-            * `self.cycle_param.frame_start_times` are trimmed to be less
-              than the maximum cycle stop time found by
+            * `self.cycle_param.frame_start_times` are sorted and trimmed to
+              be less than the maximum cycle stop time found by
               `self.cycle_param.cycle_times.stop.max()`
         """
         super().__init__(run, ucn_only)
 
         tree = self.tfile['UCNHits_Li6'].reset()
         tree.set_filter(f'tChannel == {chop_time_ch}', inplace=True)
-        times = tree.tUnixTimePrecise.to_dataframe().index.values
+        times = np.sort(tree['tUnixTimePrecise'].to_dict()['tUnixTimePrecise'])
 
         # ensure frames are within the bounds of the run
+        # times are sorted, so cut with a search rather than a boolean mask
         stop_time = self.cycle_param.cycle_times.stop.max()
-        times = times[times < stop_time]
+        times = times[:np.searchsorted(times, stop_time)]
 
         # save values
         self.cycle_param['nframes'] = len(times)
@@ -92,23 +94,16 @@ class crun(ucndata.ucnrun):
 
         # slice on cycles
         if isinstance(key, slice):
-            cycles = self.get_cycle()[:self.cycle_param.ncycles]
 
-            # no filter
-            if self.cycle_param.filter is None or all(self.cycle_param.filter):
-                cyc = cycles[key]
+            # slice the cycle numbers rather than the cycles, so that only the
+            # requested cycles are built
+            idx = np.arange(self.cycle_param.ncycles)[key]
 
-            # yes filter
-            else:
+            # fetch the filter and slice in the same way as the return value
+            if self.cycle_param.filter is not None:
+                idx = idx[self.cycle_param.filter[key]]
 
-                # fetch the filter and slice in the same way as the return value
-                cfilter = self.cycle_param.filter[key]
-
-                # fetch cycles and slice, then apply filter
-                cyc = np.array(cycles[key])
-                cyc = cyc[cfilter]
-
-            return ucndata.applylist(cyc)
+            return ucndata.applylist(map(self.get_cycle, idx.tolist()))
 
         # slice on periods and frames
         if isinstance(key, tuple):
@@ -144,18 +139,18 @@ class crun(ucndata.ucnrun):
 
     def _get_nhits_frame(self, detector, frame_time=None):
 
-        # get hits tree
-        tree = self.tfile[ucndata.DET_NAMES[detector]['hits']]
-
         # get hits for run
         if frame_time is None:
-            return tree.size
+            return self.tfile[ucndata.DET_NAMES[detector]['hits']].size
 
         else:
 
             # make hits histogram
             if self._nhits_frame is None:
 
+                # get hits tree
+                tree = self.tfile[ucndata.DET_NAMES[detector]['hits']]
+
                 # use frame start times as edges
                 edges = self.cycle_param.frame_start_times
                 runstop = self.cycle_param.period_end_times.max().max()
@@ -198,8 +193,12 @@ class crun(ucndata.ucnrun):
         """
 
         if cycle is None or cycle < 0:
-            ncycles = len(self.cycle_param.cycle_times.index)
-            return ucndata.applylist(map(self.get_cycle, range(ncycles)))
+            if self._all_cycles is None:
+                ncycles = self.cycle_param.ncycles
+                self._all_cycles = ucndata.applylist(map(self.get_cycle, range(ncycles)))
+
+            # copy so that callers may modify the list
+            return ucndata.applylist(self._all_cycles)
         elif cycle in self._cycledict.keys():
             return self._cycledict[cycle]
         else:
@@ -229,8 +228,12 @@ class crun(ucndata.ucnrun):
         # get only Li6 detector timing entries
         tree = self.tfile.UCNHits_Li6.reset()
 
-        # get hits
-        times, chans, isUCN = tree[['tUnixTimePrecise','tChannel', 'tIsUCN']].values
+        # get hits: keep each branch in its native dtype rather than stacking
+        # into a single float64 array
+        hits = tree[['tUnixTimePrecise','tChannel', 'tIsUCN']].to_dict()
+        times = hits['tUnixTimePrecise']
+        chans = hits['tChannel']
+        isUCN = hits['tIsUCN'].astype(bool)
         tof = times.copy()
 
         # get chopper rate
@@ -243,20 +246,23 @@ class crun(ucndata.ucnrun):
 
         # get only ucn hits
         if self._ucn_only:
-            tof = tof[isUCN.astype(bool)]
-            times = times[isUCN.astype(bool)]
+            tof = tof[isUCN]
+            times = times[isUCN]
 
         # get only Li6 detector hits
         else:
             times = times[chans < 10]
             tof = tof[chans < 10]
 
-        # remove bad cycles
+        # remove bad cycles: find the cycle each hit falls in by binary search
+        # rather than testing every hit against every cycle
         if self.cycle_param.filter is not None:
-            idx_keep = np.full(len(tof), False)
-            for cycle in self:
-                if cycle.cycle_param.filter:
-                    idx_keep += (times >= cycle.cycle_start) & (times < cycle.cycle_stop) 
+            start = self.cycle_param.cycle_times.start.to_numpy()
+            stop = self.cycle_param.cycle_times.stop.to_numpy()
+            icycle = np.searchsorted(start, times, side='right') - 1
+            inrun = icycle >= 0
+            icycle[~inrun] = 0
+            idx_keep = inrun & self.cycle_param.filter[icycle] & (times < stop[icycle])
             tof = tof[idx_keep]
             times = times[idx_keep]
 
@@ -299,10 +305,11 @@ class crun(ucndata.ucnrun):
                                slow=slow)
         
         # adjust frame units 
+        xmode = _get_xmode(xmode, ('datetime', 'duration', 'epoch'))
         times = self.cycle_param.frame_start_times.copy()
-        if xmode in 'datetime':
-            times = pd.to_datetime(times, unit='s')
-        elif xmode in 'duration':
+        if xmode == 'datetime':
+            times = _epoch_to_datetime(times)
+        elif xmode == 'duration':
             times -= self.cycle_param.cycle_times.loc[0, 'start']
 
         # draw
@@ -346,9 +353,9 @@ class crun(ucndata.ucnrun):
         times = self.cycle_param.frame_start_times + dt
 
         # limits checking
-        if any(times < 0):
+        if (times < 0).any():
             raise ValueError('This operation would create frames with negative start times')
-        if any(self.cycle_param.cycle_times.stop.max() - times < 0):
+        if (times > self.cycle_param.cycle_times.stop.max()).any():
             raise ValueError('This operation would create frames starting after the end of the run')
 
         # set at run level
@@ -356,14 +363,14 @@ class crun(ucndata.ucnrun):
 
         # update saved cycles
         for cycle in self._cycledict.values():
-            idx = (times >= cycle.cycle_start) & (times < cycle.cycle_stop)
-            cycle.cycle_param.frame_start_times = times[idx]
+            i0, i1 = np.searchsorted(times, (cycle.cycle_start, cycle.cycle_stop))
+            cycle.cycle_param.frame_start_times = times[i0:i1]
             cycle.cycle_param.nframes = len(cycle.cycle_param.frame_start_times)
 
             # update saved periods
             for period in cycle._perioddict.values():
-                idx = (times >= period.period_start) & (times < period.period_stop)
-                period.cycle_param.frame_start_times = times[idx]
+                i0, i1 = np.searchsorted(times, (period.period_start, period.period_stop))
+                period.cycle_param.frame_start_times = times[i0:i1]
                 period.cycle_param.nframes = len(period.cycle_param.frame_start_times)
                 period._framedict = {}
 
@@ -385,8 +392,8 @@ class ccycle(ucndata.ucncycle):
 
         # trim frame times
         times =  self.cycle_param.frame_start_times
-        idx = (times >= self.cycle_start) & (times < self.cycle_stop)
-        self.cycle_param.frame_start_times = times[idx]
+        i0, i1 = np.searchsorted(times, (self.cycle_start, self.cycle_stop))
+        self.cycle_param.frame_start_times = times[i0:i1]
         self.cycle_param.nframes = len(self.cycle_param.frame_start_times)
 
     def __getitem__(self, key):
@@ -421,10 +428,10 @@ class ccycle(ucndata.ucncycle):
         if isinstance(key, (np.integer, int)):
 
             if key < 0:
-                key = self.cycle_param.nperiods + key
+                key = self._nperiods + key
 
-            if key > self.cycle_param.nperiods:
-                raise IndexError(f'Run {self.run_number}: Index larger than number of periods ({self.cycle_param.nperiods})')
+            if key >= self._nperiods:
+                raise IndexError(f'Run {self.run_number}: Index larger than number of periods ({self._nperiods})')
 
             return self.get_period(key)
 
@@ -438,11 +445,14 @@ class ccycle(ucndata.ucncycle):
 
         # slice on periods
         elif isinstance(key, slice):
-            periods = self.get_period()[:self.cycle_param.nperiods]
+
+            # only build the periods in the slice
+            periods = range(*key.indices(self._nperiods))
+            periods = [self.get_period(i) for i in periods]
 
             # no filter
-            if self.cycle_param.filter is None or all(self.cycle_param.filter):
-                cyc = periods[key]
+            if self.cycle_param.filter is None or np.all(self.cycle_param.filter):
+                cyc = periods
 
             # yes filter
             else:
@@ -450,8 +460,8 @@ class ccycle(ucndata.ucncycle):
                 # fetch the filter and slice in the same way as the return value
                 cfilter = self.cycle_param.filter[key]
 
-                # fetch cycles and slice, then apply filter
-                cyc = np.array(periods[key])
+                # apply filter
+                cyc = np.array(periods)
                 cyc = cyc[cfilter]
 
             return ucndata.applylist(cyc)
@@ -519,8 +529,8 @@ class cperiod(ucndata.ucnperiod):
 
         # trim frame times
         times =  self.cycle_param.frame_start_times
-        idx = (times >= self.period_start) & (times < self.period_stop)
-        self.cycle_param.frame_start_times = times[idx]
+        i0, i1 = np.searchsorted(times, (self.period_start, self.period_stop))
+        self.cycle_param.frame_start_times = times[i0:i1]
         self.cycle_param.nframes = len(self.cycle_param.frame_start_times)
 
         # frame dict
@@ -620,9 +630,10 @@ class cframe(ucndata.ucnbase):
     def __init__(self, uperiod, frame):
         """Create a time-restricted view of a single chopper frame.
 
-        Copies all attributes from the parent `cperiod`, replacing `tfile` with a
-        `tsubfile` restricted to `[frame_start, frame_stop)` and rebuilding the
-        `epics` interface for the new time window. If the period contains no
+        Shares all attributes with the parent `cperiod` except `cycle_param`,
+        which is shallow-copied, `tfile`, which is replaced with a `tsubfile` restricted
+        to `[frame_start, frame_stop)`, and `epics`, which is rebuilt for the
+        new time window. If the period contains no
         frames, all time attributes are set to `None`.
 
         Args:
@@ -650,8 +661,11 @@ class cframe(ucndata.ucnbase):
                 setattr(self, key, ucndata.tsubfile.tsubfile(value, start, stop))
             elif key == 'epics':
                 setattr(self, key, ucndata.ttreeslow(value, self))
-            elif hasattr(value, 'copy'):
-                setattr(self, key, value.copy())
+            elif key in self._copy_attrs:
+
+                # shallow: the frame replaces no entries, so the period's
+                # DataFrames needn't be duplicated for each frame
+                setattr(self, key, attrdict(value))
             else:
                 setattr(self, key, value)
 
@@ -689,30 +703,4 @@ class cframe(ucndata.ucnbase):
             str: multi-line string showing run number, cycle, period, frame
                 index, and all public attribute names.
         """
-        klist = [d for d in self.__dict__.keys() if d[0] != '_']
-        if klist:
-
-            # sort without caps
-            klist.sort(key=lambda x: x.lower())
-            
-            # get number of columns based on terminal size
-            maxsize = max([len(k) for k in klist]) + 2
-            terminal_width = os.get_terminal_size().columns
-            ncolumns = int(np.floor(terminal_width / maxsize))
-            ncolumns = min((ncolumns, len(klist)))
-
-            # split into chunks
-            needed_len = int(np.ceil(len(klist) / ncolumns)*ncolumns) - len(klist)
-            klist = np.concatenate((klist, np.full(needed_len, '')))
-            klist = np.array_split(klist, ncolumns)
-
-            # print
-            cyc_str = f' (cycle {self.cycle}, period {self.period}, frame {self.frame})'
-            s = f'run {self.run_number}{cyc_str}:\n'
-            for key in zip(*klist):
-                s += '  '
-                s += ''.join(['{0: <{1}}'.format(k, maxsize) for k in key])
-                s += '\n'
-            return s
-        else:
-            return self.__class__.__name__ + "()"
+        return self._format_attrs(f' (cycle {self.cycle}, period {self.period}, frame {self.frame})')
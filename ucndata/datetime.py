@@ -6,6 +6,24 @@ import pandas as pd
 import numpy as np
 from . import ucnbase
 
+def _epoch_to_datetime(t):
+    # convert float epoch seconds to naive datetimes
+    #
+    # Args:
+    #     t (float|array-like|pd.Index): seconds since 1970-01-01 UTC, an
+    #         index keeps its name
+    #
+    # Notes:
+    #     pd.to_datetime(unit='s') on floats is far slower than on integers,
+    #     so convert to integer nanoseconds first, keeping sub-second precision
+
+    ns = np.round(np.asarray(t, dtype=float)*1e9).astype(np.int64)
+    converted = pd.to_datetime(ns, unit='ns')
+
+    if isinstance(t, pd.Index):
+        converted = converted.rename(t.name)
+    return converted
+
 def from_datetime(item):
     """Convert datetime-indexed data back to integer Unix epoch timestamps.
 
@@ -49,10 +67,10 @@ def from_datetime(item):
     # convert values
     converted = pd.Series(item)
 
-    try:
-        converted = converted.dt.tz_convert('UTC')
-    except TypeError:
+    if converted.dt.tz is None:
         converted = converted.dt.tz_localize('UTC')
+    else:
+        converted = converted.dt.tz_convert('UTC')
 
     converted -= pd.Timestamp('1970-01-01').tz_localize("UTC")
     converted = converted // pd.Timedelta('1s')
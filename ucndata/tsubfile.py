@@ -29,8 +29,8 @@ class tsubfile(tfile):
 
     def __init__(self, tfileobj, start, stop):
 
-        for key, value in tfileobj.items():
-            self[key] = value
+        # share the parent's trees; they are windowed lazily on access
+        dict.update(self, tfileobj)
 
         items = {'_start':start, '_stop':stop}
         object.__setattr__(self, '_items', items)
@@ -52,8 +52,15 @@ class tsubfile(tfile):
                 pass
             else:
                 if 'time' in index_name:
-                    idx = (val.index >= self._start) & (val.index <= self._stop)
-                    val = val.loc[idx]
+
+                    # time-sorted: slice by position from a binary search
+                    if val.index.is_monotonic_increasing:
+                        i0 = val.index.searchsorted(self._start, side='left')
+                        i1 = val.index.searchsorted(self._stop, side='right')
+                        val = val.iloc[i0:i1]
+                    else:
+                        idx = (val.index >= self._start) & (val.index <= self._stop)
+                        val = val.loc[idx]
 
         # get sub range: rootloader.ttree
         elif isinstance(val, ttree):
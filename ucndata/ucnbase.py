@@ -3,18 +3,139 @@
 # Oct 2024
 
 import ucndata
-from rootloader import ttree
+from rootloader import ttree, th1
 from .exceptions import *
-from .datetime import to_datetime
+from .datetime import to_datetime, _epoch_to_datetime
 from .applylist import applylist
+from .tsubfile import tsubfile
 import ucndata.constants as const
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle
+from matplotlib.colors import Normalize
 from tqdm import tqdm
 from collections.abc import Iterable
 import matplotlib.patches as mpatches
+import os, zlib, shutil, time, functools
+
+# BeamlineEpics columns needed for the beam properties
+_EPICS_BEAM_COLUMNS = ('B1_FOIL_ADJCUR', 'B1V_KSM_PREDCUR', 'B1V_KSM_BONPRD',
+                       'B1V_KSM_RDBEAMON_VAL1', 'B1V_KSM_RDBEAMOFF_VAL1')
+
+# terminal width for __repr__, refreshed at most once per second
+# (time of last check, width)
+_term_width = (0.0, 0)
+
+def _get_terminal_width():
+    # Get the terminal width in characters, cached for one second
+
+    # Notes:
+    #     Interactive sessions may call __repr__ many times in a row. Uses
+    #     shutil.get_terminal_size, which falls back to 80 columns if stdout is
+    #     not a terminal.
+
+    global _term_width
+
+    now = time.monotonic()
+    if now - _term_width[0] > 1.0:
+        _term_width = (now, shutil.get_terminal_size().columns)
+    return _term_width[1]
+
+@functools.lru_cache(maxsize=32)
+def _attr_layout(keys, width):
+    # Arrange attribute names in columns that fit the terminal, for __repr__
+
+    # Args:
+    #     keys (tuple): attribute names, in display order
+    #     width (int): terminal width in characters
+
+    # Returns:
+    #     str: the rows of names, each ending in a newline
+
+    # Notes:
+    #     Cached since the cycles and periods of a run share the same attribute
+    #     names, so the rendered rows are the same for each
+
+    # get number of columns based on terminal size
+    maxsize = max((len(k) for k in keys)) + 2
+    ncolumns = min(width // maxsize, len(keys))
+    ncolumns = max(ncolumns, 1)
+
+    # split into chunks
+    nrows = -(-len(keys) // ncolumns)
+    keys = keys + ('',) * (nrows*ncolumns - len(keys))
+    columns = [keys[i*nrows:(i+1)*nrows] for i in range(ncolumns)]
+
+    # one format template for all rows
+    fmt = '  ' + f'{{:<{maxsize}}}' * ncolumns + '\n'
+    return ''.join([fmt.format(*row) for row in zip(*columns)])
+
+def _get_xmode(xmode, modes):
+    # Get the full name of an x axis mode, which may be abbreviated
+
+    # Args:
+    #     xmode (str): mode name, or the start of one, e.g. 'dur'
+    #     modes (tuple): accepted mode names, in order of preference
+
+    # Returns:
+    #     str|None: full mode name, None if xmode matches none of the modes
+
+    if xmode in modes:
+        return xmode
+    if xmode:
+        for mode in modes:
+            if mode.startswith(xmode):
+                return mode
+    return None
+
+def _sorted_by_index(series):
+    # Get series sorted by its index, skipping the sort if already in order
+
+    # Args:
+    #     series (pd.Series): data to sort
+
+    # Returns:
+    #     pd.Series: series itself if its index is increasing, else a sorted copy
+
+    if series.index.is_monotonic_increasing:
+        return series
+    return series.sort_index()
+
+def _nearest_mul(times, targets, values, scale):
+    # Get values at the times nearest to each target, multiplied by scale
+
+    # Args:
+    #     times (np.ndarray): times at which values are recorded
+    #     targets (np.ndarray): times at which to look up the values
+    #     values (np.ndarray): values to look up, first axis same length as times
+    #     scale (float): multiply output by this
+
+    # Returns:
+    #     np.ndarray: same length as targets
+
+    # Notes:
+    #     Equivalent to values[argmin(abs(times - target))] for each target, but
+    #     with a binary search rather than a full scan for each target. Ties go
+    #     to the earlier time and repeated times to the first entry, as with argmin.
+
+    # sort if needed
+    if len(times) > 1 and np.any(times[1:] < times[:-1]):
+        order = np.argsort(times, kind='stable')
+        times = times[order]
+        values = values[order]
+
+    # find neighbours on either side
+    hi = np.searchsorted(times, targets, side='left')
+    hi = np.clip(hi, 0, len(times)-1)
+    lo = np.clip(hi-1, 0, len(times)-1)
+    lo = np.searchsorted(times, times[lo], side='left') # first of any repeated times
+
+    # pick the closer neighbour
+    use_hi = np.abs(times[hi] - targets) < np.abs(times[lo] - targets)
+    idx = np.where(use_hi, hi, lo)
+
+    return values[idx]*scale
 
 class ucnbase(object):
     """Base class shared by `ucnrun`, `ucncycle`, and `ucnperiod`.
@@ -50,6 +171,11 @@ class ucnbase(object):
           access to sub-timeframe views.
     """
 
+    # attributes copied from the parent object when constructing a cycle,
+    # period, or frame. These are trimmed in place by the child, so they can't
+    # be shared. All other attributes are shared with the parent
+    _copy_attrs = ('cycle_param', )
+
     def __iter__(self):
         """Initialize iteration over cycles (`ucnrun`) or periods (`ucncycle`).
 
@@ -60,45 +186,164 @@ class ucnbase(object):
         self._iter_current = 0
         return self
 
-    def _get_beam_duration(self, on=True):
-        # Get beam on/off durations
+    def _format_attrs(self, header=''):
+        # Format the public attributes in columns that fit the terminal, for __repr__
 
-        # get needed info
-        cycle_times = self.cycle_param.cycle_times
+        # Args:
+        #     header (str): appended to the run number on the first line, e.g. ' (cycle 0)'
 
-        try:
-            beam = self.tfile.BeamlineEpics
-        except AttributeError:
-            raise MissingDataError("No saved ttree named BeamlineEpics")
+        # Returns:
+        #     str
 
-        # setup storage
-        beam_dur = []
-        epics_val = 'B1V_KSM_RDBEAMON_VAL1' if on else 'B1V_KSM_RDBEAMOFF_VAL1'
+        klist = [d for d in self.__dict__.keys() if d[0] != '_']
+        if klist:
 
-        # get as dataframe
-        if isinstance(beam, ttree):
-            beam = beam[epics_val].to_dataframe()
+            # sort without caps
+            klist.sort(key=lambda x: x.lower())
+            body = _attr_layout(tuple(klist), _get_terminal_width())
 
-        # get durations closest to cycle start time
-        for start in cycle_times.start:
+            # print
+            return f'run {self.run_number}{header}:\n' + body
+        else:
+            return self.__class__.__name__ + "()"
 
-            start_times = abs(beam.index.values - start)
-            durations = beam.values*const.beam_bucket_duration_s
-            idx = np.argmin(start_times)
-            beam_dur.append(durations[idx])
+    def _get_beam_duration(self, on=True):
+        # Get beam on/off durations
 
-        out = pd.Series(beam_dur, index=cycle_times.index)
-        out.index.name = cycle_times.index.name
+        out = self.beam_durations()['on' if on else 'off'].rename(None)
 
         if len(out) == 1:
             return float(out.values[0])
 
-        # select single cycle
-        if hasattr(self, 'cycle'):
-            out = out[self.cycle]
-
         return out
 
+    def _load_epics(self):
+        # Get the beam columns of BeamlineEpics for the whole run as a DataFrame
+
+        # Notes:
+        #     Converted once and cached in self._run._epics_cache, so this can
+        #     be called up front to fill the cache before many cycles read it.
+
+        cache = self._run._epics_cache
+        if 'BeamlineEpics' not in cache.keys():
+            tree = self._run.tfile.BeamlineEpics
+
+            if isinstance(tree, ttree):
+                columns = [c for c in _EPICS_BEAM_COLUMNS if c in tree.columns]
+                tree = tree[columns].to_dataframe()
+            if isinstance(tree, pd.Series):
+                tree = tree.to_frame()
+
+            cache['BeamlineEpics'] = tree.sort_index()
+
+        return cache['BeamlineEpics']
+
+    @property
+    def _epics_df(self):
+        # Get the beam columns of BeamlineEpics as a DataFrame
+
+        # Notes:
+        #     Cycles and periods slice the run-level frame from _load_epics to
+        #     their time window rather than converting their own filtered tree.
+
+        df = self._load_epics()
+
+        # slice to the time window, same as ttree.loc: start <= t < stop
+        if isinstance(self.tfile, tsubfile):
+            i0, i1 = df.index.searchsorted((self.tfile._start, self.tfile._stop))
+            df = df.iloc[i0:i1]
+
+        return df
+
+    def _get_cycle_times_arrays(self):
+        # Get cycle start times and cycle ids as numpy arrays
+
+        # Notes:
+        #     Cached as self._cycle_times_arr to avoid repeated pandas column
+        #     access. The cache is reset whenever the cycle times are changed.
+
+        if getattr(self, '_cycle_times_arr', None) is None:
+            cycle_times = self.cycle_param.cycle_times
+            self._cycle_times_arr = (np.ascontiguousarray(cycle_times.start.to_numpy(dtype=float)),
+                                     cycle_times.index.to_numpy())
+        return self._cycle_times_arr
+
+    def _get_hits_sorted(self, detector):
+        # Get run-level hit times, sorted in time
+
+        # Notes:
+        #     Cached per detector in self._run._hits_sorted on first access.
+        #     Cycles, periods, and frames take a slice of this array by binary
+        #     search on their time window instead of reading their own filtered
+        #     tree. The array is read-only since those slices are views.
+
+        if detector not in self._run._hits_sorted.keys():
+            times = np.sort(self._run.get_hits_array(detector))
+            times.flags.writeable = False
+            self._run._hits_sorted[detector] = times
+        return self._run._hits_sorted[detector]
+
+    def _get_hits_us(self, detector):
+        # Get run-level hit times as int64 microseconds since epoch
+
+        # Notes:
+        #     Cached per detector in self._run._hits_us on first access, so that
+        #     histograms are integer bin assignments rather than float subtractions
+        #     between near-identical large timestamps. Converted from the sorted
+        #     float times of _get_hits_sorted, so the hit branch is read only once.
+
+        if detector not in self._run._hits_us.keys():
+            times = self._get_hits_sorted(detector)
+            self._run._hits_us[detector] = np.rint(times * 1e6).astype(np.int64)
+        return self._run._hits_us[detector]
+
+    def _hits_times_np(self, detector):
+        # Get hit times as a numpy array without building a DataFrame
+
+        # Notes:
+        #     For a ttree only the time branch is read, straight into numpy with
+        #     RDataFrame.AsNumpy. DataFrames (already in memory) use their index.
+        #     Below the run level the output is a time-sorted, read-only view.
+
+        # cycles, periods, frames: slice the run-level array, same as ttree.loc
+        if isinstance(self.tfile, tsubfile):
+            times = self._get_hits_sorted(detector)
+            i0, i1 = np.searchsorted(times, (self.tfile._start, self.tfile._stop))
+            return times[i0:i1]
+
+        tree = self.tfile[ucndata.DET_NAMES[detector]['hits']]
+
+        if not isinstance(tree, ttree):
+            return tree.index.to_numpy(dtype=float)
+
+        # check the disk cache: full run only
+        filename = None
+        if ucndata.CACHEDIR is not None and self is self._run:
+            filename = self._get_cache_path(tree)
+            if os.path.isfile(filename) and \
+               os.path.getmtime(filename) >= os.path.getmtime(self.path):
+                return np.load(filename)
+
+        times = tree['tUnixTimePrecise'].to_dict()['tUnixTimePrecise']
+
+        # save to the disk cache
+        if filename is not None:
+            os.makedirs(ucndata.CACHEDIR, exist_ok=True)
+            np.save(filename, times)
+
+        return times
+
+    def _get_cache_path(self, tree):
+        # Get path to the file caching the hit times of a ttree
+
+        # Notes:
+        #     The file name includes a checksum of the tree filters, such that
+        #     runs loaded with different filters (e.g. ucn_only) don't share files
+
+        run_name = os.path.splitext(os.path.basename(self._run.path))[0]
+        filters = zlib.crc32('&&'.join(tree.filters).encode())
+        return os.path.join(ucndata.CACHEDIR, f'{run_name}_{tree.name}_{filters:08x}.npy')
+
     def apply(self, fn_handle):
         """Apply function to each cycle
 
@@ -116,6 +361,141 @@ class ucnbase(object):
         """
         return applylist([fn_handle(c) for c in self])
 
+    def batch_apply(self, tree, column, reduce='sum'):
+        """Reduce a tree column within each cycle in a single vectorized pass
+
+        Fast alternative to `apply` for simple reductions: rather than building
+        a `ucncycle` per cycle, the rows of the column are assigned to cycles
+        with `np.searchsorted` on the cycle start times and reduced together.
+
+        Args:
+            tree (str): name of the tree in `self.tfile`, e.g. `BeamlineEpics`
+            column (str): name of the column to reduce
+            reduce (str): `sum`|`mean`|`count`|`min`|`max`
+
+        Returns:
+            applylist: reduced value for each cycle, respecting the cycle filter.
+                If called from a cycle, period, or frame, returns a single value
+                reduced over this object's time window only (e.g. a period gives
+                the reduction over that period, not its whole cycle).
+
+        Notes:
+            * Rows are assigned to the cycle whose [start, stop) interval contains
+              their timestamp. Cycles without rows are reduced to 0 for `sum` and
+              `count`, and `nan` otherwise.
+
+        Example:
+            ```python
+            >>> run.batch_apply('UCNHits_Li6', 'tIsUCN', reduce='count')
+            [np.int64(4321), np.int64(4289), np.int64(4302)]
+
+            # equivalent but slower
+            >>> run.apply(lambda c: len(c.tfile.UCNHits_Li6.tIsUCN))
+            ```
+        """
+
+        # check input
+        if reduce not in ('sum', 'mean', 'count', 'min', 'max'):
+            raise RuntimeError('reduce must be one of sum|mean|count|min|max')
+
+        # get data
+        data = self.tfile[tree]
+        if isinstance(data, ttree):
+            data = data[column].to_dataframe()
+        else:
+            data = data[column]
+
+        times = data.index.to_numpy()
+        values = data.to_numpy(dtype=float)
+
+        # assign rows to cycles
+        starts, _ = self._get_cycle_times_arrays()
+        stops = self.cycle_param.cycle_times.stop.to_numpy(dtype=float)
+        ncycles = len(starts)
+
+        cycle_id = np.searchsorted(starts, times, side='right') - 1
+        keep = cycle_id >= 0
+        keep[keep] = times[keep] < stops[cycle_id[keep]]
+        cycle_id = cycle_id[keep]
+        values = values[keep]
+
+        # reduce
+        counts = np.bincount(cycle_id, minlength=ncycles)
+
+        if reduce == 'count':
+            out = counts
+
+        elif reduce in ('sum', 'mean'):
+            out = np.bincount(cycle_id, weights=values, minlength=ncycles)
+            if reduce == 'mean':
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    out = out / counts
+
+        else:
+            out = np.full(ncycles, np.nan)
+            order = np.argsort(cycle_id, kind='stable')
+            ids, first = np.unique(cycle_id[order], return_index=True)
+            if len(ids) > 0:
+                fn = np.minimum if reduce == 'min' else np.maximum
+                out[ids] = fn.reduceat(values[order], first)
+
+        # select single cycle
+        if hasattr(self, 'cycle'):
+            return out[self.cycle]
+
+        # apply the cycle filter
+        if self.cycle_param.filter is not None:
+            out = out[self.cycle_param.filter]
+
+        return applylist(out)
+
+    def beam_durations(self):
+        """Get the beam-on and beam-off durations in seconds for each cycle
+
+        Both durations are taken from the `BeamlineEpics` entry closest in time
+        to the cycle start, `B1V_KSM_RDBEAMON_VAL1` and `B1V_KSM_RDBEAMOFF_VAL1`,
+        in a single pass. `beam_on_s` and `beam_off_s` are views of this output.
+
+        Returns:
+            pd.DataFrame: indexed by cycle number, columns `on` and `off`.
+                If called from a cycle or period, contains only that cycle.
+
+        Example:
+            ```python
+            >>> run.beam_durations()
+                          on         off
+            cycle
+            0      59.999284  229.999918
+            1      59.999284  229.999918
+            2      59.999284  229.999918
+            ```
+        """
+
+        # get needed info
+        starts, cycle_ids = self._get_cycle_times_arrays()
+
+        try:
+            beam = self._epics_df
+        except AttributeError:
+            raise MissingDataError("No saved ttree named BeamlineEpics")
+
+        beam_val = beam[['B1V_KSM_RDBEAMON_VAL1', 'B1V_KSM_RDBEAMOFF_VAL1']]
+
+        # get durations closest to cycle start time
+        beam_dur = _nearest_mul(beam.index.to_numpy(dtype=float),
+                                starts,
+                                beam_val.to_numpy(dtype=float),
+                                const.beam_bucket_duration_s)
+
+        out = pd.DataFrame(beam_dur, index=cycle_ids, columns=['on', 'off'])
+        out.index.name = self.cycle_param.cycle_times.index.name
+
+        # select single cycle
+        if hasattr(self, 'cycle'):
+            out = out.loc[[self.cycle]]
+
+        return out
+
     def get_hits_array(self, detector):
         """Get times of ucn hits as a numpy array
 
@@ -123,7 +503,7 @@ class ucnbase(object):
             detector (str): one of the keys to `ucndata.DET_NAMES`
 
         Returns:
-            np.array: array of timestamps corresponding to an UCN hit. Note that this returns all events in the case where `ucn_only=False`
+            np.array: array of timestamps corresponding to an UCN hit. Note that this returns all events in the case where `ucn_only=False`. For cycles, periods, and frames the timestamps are sorted in time and the array is read-only
 
         Example:
             ```python
@@ -137,22 +517,23 @@ class ucnbase(object):
         if detector not in ucndata.DET_NAMES.keys():
             raise KeyError(f'Detector input "{detector}" not one of {tuple(ucndata.DET_NAMES.keys())}')
 
-        # get the tree
-        tree = self.tfile[ucndata.DET_NAMES[detector]['hits']]
-
-        return tree.tUnixTimePrecise.to_dataframe().index.values
+        return self._hits_times_np(detector)
 
     def get_hits_histogram(self, detector, bin_ms=10, as_datetime=False):
         """Get histogram of UCNHits ttree times
 
         Args:
             detector (str): `Li6`|`He3`
-            bin_ms (int): histogram bin size in milliseconds
+            bin_ms (int): histogram bin size in milliseconds, rounded to whole
+                microseconds; must be at least 0.001 (1 us)
             as_datetime (bool): if true, convert `bin_centers` to datetime objects
 
         Returns:
             rootloader.th1: histogram object
 
+        Raises:
+            ValueError: if `bin_ms` is less than 1 us
+
         Example:
             ```python
             >>> run.get_hits_histogram('He3')
@@ -184,14 +565,35 @@ class ucnbase(object):
         if detector not in ucndata.DET_NAMES.keys():
             raise KeyError(f'Detector input "{detector}" not one of {tuple(ucndata.DET_NAMES.keys())}')
 
-        # get data
-        tree = self._run.tfile[ucndata.DET_NAMES[detector]['hits']]
+        # bins are whole microseconds
+        bin_us = int(round(bin_ms*1000))
+        if bin_ms*1000 < 1:
+            raise ValueError(f'bin_ms must be at least 0.001 (1 us), got {bin_ms}')
 
-        # histogram
-        hist = tree.hist1d('tUnixTimePrecise', step=bin_ms/1000)
+        # get data
+        times_us = self._get_hits_us(detector)
 
-        # make a copy
-        hist = hist.copy()
+        # histogram as integer bin assignment
+        if len(times_us) > 0:
+            t0_us = times_us[0]     # sorted
+            counts = np.bincount((times_us - t0_us) // bin_us).astype(float)
+        else:
+            t0_us = 0
+            counts = np.zeros(0)
+
+        # decode bin centers back to seconds
+        hist = th1()
+        hist.base_class = 'TH1D'
+        hist.name = 'HisttUnixTimePrecise'
+        hist.title = ''
+        hist.xlabel = 'tUnixTimePrecise'
+        hist.ylabel = 'Count'
+        hist.x = (t0_us + (np.arange(len(counts)) + 0.5) * bin_us) / 1e6
+        hist.y = counts
+        hist.dy = np.sqrt(counts)
+        hist.sum = np.sum(hist.y)
+        hist.entries = int(hist.sum)
+        hist.nbins = len(hist.x)
 
         # trim axes
         if hasattr(self, 'frame_start'):
@@ -258,7 +660,8 @@ class ucnbase(object):
         """
 
         # check input
-        if all((xmode not in i for i in ('datetime', 'duration', 'epoch'))):
+        xmode = _get_xmode(xmode, ('datetime', 'duration', 'epoch'))
+        if xmode is None:
             raise RuntimeError('xmode must be one of datetime|duration|epoch')
 
         # number of rows in figure
@@ -285,8 +688,7 @@ class ucnbase(object):
                         layout='constrained', figsize=(8,10))
 
         # get current and histogram
-        current = self.beam1a_current_uA
-        current.sort_index(inplace=True)
+        current = _sorted_by_index(self.beam1a_current_uA)
         hist = self.get_hits_histogram(detector, bin_ms=bin_ms).to_dataframe()
         hist.set_index('tUnixTimePrecise', inplace=True)
         hist = hist['Count']
@@ -297,21 +699,42 @@ class ucnbase(object):
 
         # period
         if hasattr(self, 'period'):
-            type = 'Period'
-            run_start = self.period_start
             raise NotImplementedError('Inspect for periods not yet implemented')
         
         # cycle
         elif hasattr(self, 'cycle'):
             type = 'Cycle'
             run_start = self.cycle_start
-            self._inspect_draw(current, hist, run_start, axes, xmode, slow)
+            cycles = [self]
+
+        # full run
+        else:
+            type = 'Run'
+            run_start = self.cycle_param.cycle_times.loc[0, 'start']
+            cycles = self.get_cycle()
+
+        # x axis conversion, applied once to each series rather than to each
+        # period's slice of it
+        if xmode == 'datetime':     to_x = _epoch_to_datetime
+        elif xmode == 'duration':   to_x = lambda t: t - run_start
+        else:                       to_x = lambda t: t
+
+        current = current.set_axis(to_x(current.index))
+        hist = hist.set_axis(to_x(hist.index))
+        if slow is not None:
+            slow = {key: _sorted_by_index(val.set_axis(to_x(val.index))) for key, val in slow.items()}
+
+        # draw each cycle
+        for cyc in cycles:
+            cyc._inspect_draw(current, hist, to_x, axes, slow)
+
+        # cycle
+        if type == 'Cycle':
             
             # draw vertical markers
-            if xmode in 'duration':
+            if xmode == 'duration':
                 xmode = 'duration_cycle'
-            for i, ax in enumerate(axes):
-                non_zero_periods = self.draw_cycle_times(ax=ax, xmode=xmode)
+            non_zero_periods = self.draw_cycle_times(ax=axes, xmode=xmode)
 
             # title is run, cycle number
             axes[0].set_title(f'run {self.run_number}, cycle {self.cycle}',
@@ -319,16 +742,9 @@ class ucnbase(object):
 
         # full run
         else:
-            type = 'Run'
-            run_start = self.cycle_param.cycle_times.loc[0, 'start']
-
-            # draw each cycle
-            for cyc in self.get_cycle():
-                cyc._inspect_draw(current, hist, run_start, axes, xmode, slow)
 
             # draw vertical markers
-            for i, ax in enumerate(axes):
-                non_zero_periods = self.get_cycle().draw_cycle_times(ax=ax, xmode=xmode)
+            non_zero_periods = self.get_cycle().draw_cycle_times(ax=axes, xmode=xmode)
             non_zero_periods = np.concat(non_zero_periods)
 
             # title is run number
@@ -344,9 +760,9 @@ class ucnbase(object):
             for i, ax in enumerate(axes[2:]):
                 ax.set_ylabel(slow_keys[i].split('_')[-2])
 
-        if xmode in 'datetime':
+        if xmode == 'datetime':
             axes[-1].set_xlabel('')
-        elif xmode in 'duration' or xmode in 'duration_cycle' or xmode in 'duration_run':
+        elif xmode in ('duration', 'duration_cycle'):
             axes[-1].set_xlabel(f'Time Since {type} Start (s)')
         else:
             axes[-1].set_xlabel('Epoch Time')
@@ -389,9 +805,8 @@ class ucnbase(object):
         tree = self.tfile[ucndata.DET_NAMES[detector]['hits']].reset()
         tree.set_filter("tUnixTimePrecise > 15e8", inplace=True)
 
-        # calculate new psd
-        tree.set_filter("tChargeL > 0", inplace=True)
-        tree.set_filter("tChargeL < 5e3", inplace=True)
+        # calculate new psd: single filter node for the charge window
+        tree.set_filter("tChargeL > 0 && tChargeL < 5e3", inplace=True)
 
         # Li detector figures
         fig, axes = plt.subplots(nrows=3, ncols=3, sharex=True, sharey=True,
@@ -422,17 +837,22 @@ class ucnbase(object):
             # save
             hist_edges.append((hist.z, xedge, yedge))
 
-        # get max
+        # get max, shared colour scale for all channels
         max_bin_count = np.max([np.max(h[0]) for h in hist_edges])
+        norm = Normalize(vmin=0, vmax=max_bin_count/10)
 
-
-        # draw
+        # draw: bins are uniform so imshow is equivalent to pcolormesh, but
+        # skips the per-quad coordinate transforms
         for i in range(9):
             ax = axes[i]
             hist, xbins, ybins = hist_edges[i]
-            c = ax.pcolormesh(xbins, ybins, hist,
-                              cmap=cmap,
-                              vmin=0, vmax=max_bin_count/10)
+            c = ax.imshow(hist,
+                          origin='lower',
+                          extent=(xbins[0], xbins[-1], ybins[0], ybins[-1]),
+                          aspect='auto',
+                          interpolation='nearest',
+                          cmap=cmap,
+                          norm=norm)
             if i in (2, 5, 8):
                 plt.gcf().colorbar(c, ax=ax)
             ax.set_title(f'CH {i}', fontsize='x-small')
@@ -509,10 +929,7 @@ class ucnbase(object):
             dtype: float64
             ```
         """
-        if type(self.tfile.BeamlineEpics) is pd.DataFrame:
-            return self.tfile.BeamlineEpics.B1_FOIL_ADJCUR.copy()
-        else:
-            return self.tfile.BeamlineEpics.B1_FOIL_ADJCUR.to_dataframe()
+        return self._epics_df['B1_FOIL_ADJCUR'].copy()
 
     @property
     def beam1u_current_uA(self):
@@ -552,11 +969,12 @@ class ucnbase(object):
 
         # BONPRD is a bool, which indicates if there is beam down 1U
 
-        df = self.tfile.BeamlineEpics[['B1V_KSM_PREDCUR', 'B1V_KSM_BONPRD']]
-        df = df.to_dataframe()
+        df = self._epics_df
 
-        # current in the 1U beamline
-        return df.B1V_KSM_PREDCUR * df.B1V_KSM_BONPRD
+        # current in the 1U beamline: multiply the raw arrays, skipping index alignment
+        return pd.Series(df['B1V_KSM_PREDCUR'].to_numpy(copy=False) * \
+                         df['B1V_KSM_BONPRD'].to_numpy(copy=False),
+                         index=df.index)
 
     @property
     def beam_on_s(self):
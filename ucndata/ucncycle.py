@@ -5,7 +5,8 @@
 import ucndata
 from .exceptions import *
 from .applylist import applylist
-from .ucnbase import ucnbase
+from .ucnbase import ucnbase, _get_xmode
+from .datetime import _epoch_to_datetime
 from .ucnperiod import ucnperiod
 from .tsubfile import tsubfile
 from .ttreeslow import ttreeslow
@@ -14,7 +15,17 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 import numpy as np
-import os
+
+# check_data failure handlers: return False or raise error(message)
+def _warn_quiet(error, message):
+    return False
+
+def _warn_raise(error, message):
+    raise error(message)
+
+def _warn_print(error, message):
+    tqdm.write(message)
+    return False
 
 class ucncycle(ucnbase):
     """View for the data from a single UCN cycle
@@ -31,9 +42,10 @@ class ucncycle(ucnbase):
     def __init__(self, urun, cycle):
         """Initialize a ucncycle by slicing a ucnrun to a single cycle's time window.
 
-        Copies all attributes from ``urun``, replacing ``tfile`` with a
-        ``tsubfile`` restricted to [cycle_start, cycle_stop] and rebuilding
-        ``epics`` against the new tsubfile. Cycle-level ``period_durations_s``
+        Shares all attributes with ``urun`` except ``cycle_param``, which is
+        copied, ``tfile``, which is replaced with a ``tsubfile`` restricted to
+        [cycle_start, cycle_stop], and ``epics``, which is rebuilt against the
+        new tsubfile. Cycle-level ``period_durations_s``
         and ``period_end_times`` are trimmed to the selected cycle.
 
         Args:
@@ -52,7 +64,7 @@ class ucncycle(ucnbase):
                 setattr(self, key, tsubfile(value, start, stop))
             elif key == 'epics':
                 setattr(self, key, ttreeslow(value, self))
-            elif hasattr(value, 'copy'):
+            elif key in self._copy_attrs:
                 setattr(self, key, value.copy())
             else:
                 setattr(self, key, value)
@@ -61,8 +73,14 @@ class ucncycle(ucnbase):
         self.cycle_param.period_durations_s = self.cycle_param.period_durations_s[cycle]
         self.cycle_param.period_end_times = self.cycle_param.period_end_times[cycle]
 
+        # number of periods, used for iteration and indexing
+        self._nperiods = int(self.cycle_param.nperiods)
+
+        # sum of period durations, used by check_data
+        self._period_durations_total_s = float(self.cycle_param.period_durations_s.sum())
+
         if self.cycle_param.filter is not None:
-            self.cycle_param.filter = self.cycle_param.filter[cycle]
+            self.cycle_param.filter = bool(self.cycle_param.filter[cycle])
 
         self.cycle = cycle
         self.supercycle = supercycle
@@ -79,7 +97,7 @@ class ucncycle(ucnbase):
         Returns:
             int: number of periods defined in ``cycle_param.nperiods``.
         """
-        return self.cycle_param.nperiods
+        return self._nperiods
 
     def __next__(self):
         """Advance the iterator and return the next period.
@@ -96,7 +114,7 @@ class ucncycle(ucnbase):
         # permit iteration over object like it was a list
 
         # iterate
-        if self._iter_current < self.cycle_param.nperiods:
+        if self._iter_current < self._nperiods:
             cyc = self[self._iter_current]
             self._iter_current += 1
             return cyc
@@ -116,33 +134,8 @@ class ucncycle(ucnbase):
             str: formatted multi-column attribute listing, e.g.
                 ``"run 1846 (cycle 0):\\n  attr1  attr2  ..."``.
         """
-        klist = [d for d in self.__dict__.keys() if d[0] != '_']
-        if klist:
-
-            # sort without caps
-            klist.sort(key=lambda x: x.lower())
-
-            # get number of columns based on terminal size
-            maxsize = max((len(k) for k in klist)) + 2
-            terminal_width = os.get_terminal_size().columns
-            ncolumns = int(np.floor(terminal_width / maxsize))
-            ncolumns = min(ncolumns, len(klist))
-
-            # split into chunks
-            needed_len = int(np.ceil(len(klist) / ncolumns)*ncolumns) - len(klist)
-            klist = np.concatenate((klist, np.full(needed_len, '')))
-            klist = np.array_split(klist, ncolumns)
-
-            # print
-            cyc_str = '' if self.cycle is None else f' (cycle {self.cycle})'
-            s = f'run {self.run_number}{cyc_str}:\n'
-            for key in zip(*klist):
-                s += '  '
-                s += ''.join(['{0: <{1}}'.format(k, maxsize) for k in key])
-                s += '\n'
-            return s
-        else:
-            return self.__class__.__name__ + "()"
+        cyc_str = '' if self.cycle is None else f' (cycle {self.cycle})'
+        return self._format_attrs(cyc_str)
 
     def __getitem__(self, key):
         """Index into the cycle to retrieve one or more periods.
@@ -170,89 +163,67 @@ class ucncycle(ucnbase):
         # get a single key
         if isinstance(key, (np.integer, int)):
             if key < 0:
-                key = self.cycle_param.nperiods + key
+                key = self._nperiods + key
 
-            if key > self.cycle_param.nperiods:
-                raise IndexError(f'Run {self.run_number}, cycle {self.cycle}: Index larger than number of periods ({self.cycle_param.nperiods})')
+            if key >= self._nperiods:
+                raise IndexError(f'Run {self.run_number}, cycle {self.cycle}: Index larger than number of periods ({self._nperiods})')
 
             return self.get_period(key)
 
         # slice on cycles
+        # only build the periods in the slice
         if isinstance(key, slice):
-            period = self.get_period()[:self.cycle_param.nperiods]
-            return applylist(period[key])
+            periods = range(*key.indices(self._nperiods))
+            return applylist(map(self.get_period, periods))
 
         raise IndexError('Cycles indexable only as a 1-dimensional object')
 
-    def _inspect_draw(self, current, hist, run_start, axes, xmode='duration', slow=None):
+    def _inspect_draw(self, current, hist, to_x, axes, slow=None):
         # drawing portion of the inspect function
-        for i, per in enumerate(self):
+
+        # Args:
+        #     current, hist (pd.Series): indexed in x axis units, sorted
+        #     to_x (function): converts epoch times to x axis units
+        #     axes (list): axes to draw in
+        #     slow (dict|None): slow control series, indexed in x axis units, sorted
+
+        # period bounds in x axis units, converted together
+        ends = self.cycle_param.period_end_times.to_numpy()
+        edges = to_x(np.concatenate(([self.cycle_start], ends, [self.cycle_stop])))
+
+        # split a sorted series at the edges, bounds inclusive as with .loc:
+        # one binary search per series rather than a label slice per period
+        def split(series):
+            lo = series.index.searchsorted(edges, side='left')
+            hi = series.index.searchsorted(edges, side='right')
+            return [series.iloc[lo[i]:hi[i+1]] for i in range(len(edges)-1)]
+
+        current = split(current)
+        hist = split(hist)
+        if slow is not None:
+            slow = [split(val) for val in slow.values()]
+
+        # one colour per period, then black for the rest of the run
+        colors = [f'C{i}' for i in range(len(ends))] + ['k']
+
+        for i, color in enumerate(colors):
 
             # draw current
-            cur = current.loc[per.period_start:per.period_stop]
+            cur = current[i]
 
             if len(cur) > 0:
-                if xmode in 'datetime':
-                    cur.index = pd.to_datetime(cur.index, unit='s')
-                elif xmode in 'duration':
-                    cur.index -= run_start
-
-                cur.plot(ax=axes[0], color=f'C{i}')
+                cur.plot(ax=axes[0], color=color)
 
             # draw histogram
-            hi = hist.loc[per.period_start:per.period_stop]
+            hi = hist[i]
 
             if len(hi) > 0:
-                if xmode in 'datetime':
-                    hi.index = pd.to_datetime(hi.index, unit='s')
-                elif xmode in 'duration':
-                    hi.index -= run_start
-
-                hi.plot(ax=axes[1], color=f'C{i}')
+                hi.plot(ax=axes[1], color=color)
 
             # draw slow control
             if slow is not None:
-                for j, (key, val) in enumerate(slow.items()):
-                    v = val.loc[per.period_start:per.period_stop]
-                    if len(v) > 0:
-                        if xmode in 'datetime':
-                            v.index = pd.to_datetime(v.index, unit='s')
-                        elif xmode in 'duration':
-                            v.index -= run_start
-                    v.plot(ax=axes[j+2], color=f'C{i}')
-
-        # draw the rest of the run - current
-        cur = current.loc[per.period_stop:self.cycle_stop]
-
-        if len(cur) > 0:
-            if xmode in 'datetime':
-                cur.index = pd.to_datetime(cur.index, unit='s')
-            elif xmode in 'duration':
-                cur.index -= run_start
-
-            cur.plot(ax=axes[0], color=f'k')
-
-        # draw the rest of the run - histogram
-        hi = hist.loc[per.period_stop:self.cycle_stop]
-
-        if len(hi) > 0:
-            if xmode in 'datetime':
-                hi.index = pd.to_datetime(hi.index, unit='s')
-            elif xmode in 'duration':
-                hi.index -= run_start
-
-            hi.plot(ax=axes[1], color=f'k')
-
-        # draw slow control
-        if slow is not None:
-            for i, (key, val) in enumerate(slow.items()):
-                v = val.loc[per.period_stop:self.cycle_stop]
-                if len(v) > 0:
-                    if xmode in 'datetime':
-                        v.index = pd.to_datetime(v.index, unit='s')
-                    elif xmode in 'duration':
-                        v.index -= run_start
-                v.plot(ax=axes[i+2], color=f'k')
+                for j, val in enumerate(slow):
+                    val[i].plot(ax=axes[j+2], color=color)
 
     def check_data(self, raise_error=False, quiet=False):
         """Run some checks to determine if the data is ok.
@@ -287,51 +258,56 @@ class ucncycle(ucnbase):
         msg = f'Run {self.run_number}, cycle {self.cycle}:'
 
         # setup raise or warn
-        if quiet:
-            def warn(error, message):
-                return False
-        elif raise_error:
-            def warn(error, message):
-                raise error(message)
-        else:
-            def warn(error, message):
-                tqdm.write(message)
-                return False
+        if quiet:           warn = _warn_quiet
+        elif raise_error:   warn = _warn_raise
+        else:               warn = _warn_print
+
+        # fetch once, reused below
+        epics = self._epics_df
+        beam1a = epics['B1_FOIL_ADJCUR'].to_numpy()
+        min_current = ucndata.DATA_CHECK_THRESH['beam_min_current']
+        actual_duration = self.cycle_stop - self.cycle_start
 
         ## overall data quality checks ---------------------------------------
 
         # beam data exists
-        if len(self.beam1a_current_uA) == 0:
+        if len(beam1a) == 0:
             return warn(BeamError, f'{msg} No 1A beam data saved')
 
-        if len(self.beam1u_current_uA) == 0:
+        if len(epics['B1V_KSM_PREDCUR']) == 0:
             return warn(BeamError, f'{msg} No 1U beam data saved')
 
         # total duration
-        if self.cycle_stop - self.cycle_start <= 0:
-            return warn(DataError, f'{msg} Cycle duration nonsensical: {self.cycle_stop - self.cycle_start} s')
+        if actual_duration <= 0:
+            return warn(DataError, f'{msg} Cycle duration nonsensical: {actual_duration} s')
 
         # valve states
-        if not self.cycle_param.valve_states.any().any():
+        if not self.cycle_param.valve_states.to_numpy().any():
             return warn(ValveError, f'{msg} No valves operated')
 
         # check if period duration exceeds cycle duration
-        expected_duration = self.cycle_param.period_durations_s.sum()
-        actual_duration = self.cycle_stop - self.cycle_start
+        expected_duration = self._period_durations_total_s
         if expected_duration > actual_duration:
             return warn(DataError, f'{msg} cycle duration ({actual_duration:.1f} s) shorter than sum of periods ({expected_duration:.1f} s)')
 
         # drop cycles where the 1A beam drops to zero during any time in the cycle
-        if any(self.beam1a_current_uA < ucndata.DATA_CHECK_THRESH['beam_min_current']):
-            return warn(BeamError, f'{msg} 1A current dropped below {ucndata.DATA_CHECK_THRESH["beam_min_current"]} uA')
+        if (beam1a < min_current).any():
+            return warn(BeamError, f'{msg} 1A current dropped below {min_current} uA')
 
         # drop cycles where the 1A beam drops to zero within 5 s of the cycle starting
         if self.cycle > 0:
-            cyc_last = self._run[self.cycle-1]
-            current = cyc_last.beam1a_current_uA
-            idx = current.index > self.cycle_start-20
-            if any(current.loc[idx] < ucndata.DATA_CHECK_THRESH["beam_min_current"]):
-                return warn(BeamError, f'{msg} 1A current dropped below {ucndata.DATA_CHECK_THRESH["beam_min_current"]} uA within 20 seconds of the cycle starting')
+
+            # read the previous cycle's window from the run-level beam data
+            # rather than building the previous ucncycle
+            last = self.cycle_param.cycle_times.loc[self.cycle-1]
+            current = self._run._epics_df['B1_FOIL_ADJCUR']
+
+            # current is time-sorted: find the tail by binary search
+            i0 = max(current.index.searchsorted(int(last['start']), side='left'),
+                     current.index.searchsorted(self.cycle_start-20, side='right'))
+            i1 = current.index.searchsorted(int(last['stop']), side='left')
+            if (current.to_numpy()[i0:i1] < min_current).any():
+                return warn(BeamError, f'{msg} 1A current dropped below {min_current} uA within 20 seconds of the cycle starting')
 
         return True
 
@@ -342,7 +318,8 @@ class ucncycle(ucnbase):
         is excluded by ``cycle_param.filter``, the label is struck through in red.
 
         Args:
-            ax (plt.Axes): axes to draw into. Uses ``plt.gca()`` when None.
+            ax (plt.Axes|iterable): axes to draw into, or several axes to
+                draw the same markers into. Uses ``plt.gca()`` when None.
             xmode (str): x-axis time representation. One of:
 
                 * ``'datetime'`` — absolute wall-clock timestamps
@@ -368,48 +345,37 @@ class ucncycle(ucnbase):
         """
 
         # check input
-        if all((xmode not in i for i in ('datetime', 'duration', 'duration_run', 'duration_cycle', 'epoch'))):
+        xmode = _get_xmode(xmode, ('datetime', 'duration', 'duration_run', 'duration_cycle', 'epoch'))
+        if xmode is None:
             raise RuntimeError('xmode must be one of datetime|duration_run|duration_cycle|epoch')
 
-        # get axis to draw in
+        # get axes to draw in
         if ax is None:
             ax = plt.gca()
+        axes = ax if np.iterable(ax) else [ax]
 
         # run start time
-        if xmode in 'duration_run':
+        if xmode in ('duration', 'duration_run'):
             run_start = self._run.cycle_param.cycle_times.loc[0, 'start']
-        elif xmode in 'duration_cycle':
+        elif xmode == 'duration_cycle':
             run_start = self.cycle_start
         else:
             run_start = 0
 
-        # draw lines
-        non_zero_periods = []
+        # period start and stop times, as for each ucnperiod, skipping zero
+        # length periods
+        stops = self.cycle_param.period_end_times.to_numpy()
+        starts = np.concatenate(([self.cycle_start], stops[:-1]))
+        non_zero_periods = np.flatnonzero(starts != stops)
+        stops = stops[non_zero_periods]
 
-        # get x value
-        if xmode in 'datetime':
+        # get x values
+        if xmode == 'datetime':
             start = pd.to_datetime(self.cycle_start, unit='s')
+            xstops = _epoch_to_datetime(stops)
         else:
             start = self.cycle_start - run_start
-
-        # draw
-        ax.axvline(start, color='k', ls='-', lw=2)
-
-        for i, per in enumerate(self.get_period()):
-
-            # skip zero length periods
-            if per.period_start == per.period_stop:
-                continue
-
-            # get x value
-            if xmode in 'datetime':
-                x = pd.to_datetime(per.period_stop, unit='s')
-            else:
-                x = per.period_stop - run_start
-
-            # draw
-            ax.axvline(x, color=f'C{i}', ls=':', lw=1)
-            non_zero_periods.append(i)
+            xstops = stops - run_start
 
         # get cycle text - strikeout if not good
         text = f'Cycle {self.cycle}'
@@ -423,17 +389,23 @@ class ucncycle(ucnbase):
 
         text += ' $\\downarrow$'
 
-        ypos = ax.get_ylim()[1]
-        ax.text(start, ypos, text,
-                va='top',
-                ha='left',
-                fontsize='xx-small',
-                color=color,
-                rotation='vertical',
-                clip_on=True,)
+        # draw: positions and label are the same for all axes
+        for ax in axes:
+            ax.axvline(start, color='k', ls='-', lw=2)
+            for i, x in zip(non_zero_periods, xstops):
+                ax.axvline(x, color=f'C{i}', ls=':', lw=1)
+
+            ypos = ax.get_ylim()[1]
+            ax.text(start, ypos, text,
+                    va='top',
+                    ha='left',
+                    fontsize='xx-small',
+                    color=color,
+                    rotation='vertical',
+                    clip_on=True,)
 
         # add periods to legend
-        return np.unique(non_zero_periods)
+        return non_zero_periods
 
     def get_nhits(self, detector, bin_ms=0):
         """Get the total number of UCN hits recorded in this cycle.
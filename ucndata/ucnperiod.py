@@ -7,9 +7,9 @@ from .exceptions import *
 from .ucnbase import ucnbase
 from .tsubfile import tsubfile
 from .ttreeslow import ttreeslow
+from rootloader import attrdict
 
 import numpy as np
-import os
 
 class ucnperiod(ucnbase):
     """Stores the data from a single UCN period from a single cycle
@@ -22,11 +22,13 @@ class ucnperiod(ucnbase):
     def __init__(self, ucycle, period):
         """Initialize a ucnperiod by slicing a ucncycle to a single period's time window.
 
-        Copies all attributes from ``ucycle``, replacing ``tfile`` with a
-        ``tsubfile`` restricted to [period_start, period_stop] and rebuilding
-        ``epics`` against the new tsubfile. ``period_durations_s`` and
-        ``period_end_times`` in ``cycle_param`` are trimmed to the scalar
-        values for this period.
+        Shares all attributes with ``ucycle`` except ``cycle_param``, which is
+        shallow-copied, ``tfile``, which is replaced with a ``tsubfile``
+        restricted to [period_start, period_stop], and ``epics``, which is
+        rebuilt against the new tsubfile. ``period_durations_s`` and
+        ``period_end_times`` in ``cycle_param`` keep the cycle's per-period
+        arrays; the scalar values for this period are stored alongside as
+        ``period_duration_s`` and ``period_end_time``.
 
         Args:
             ucycle (ucncycle): parent cycle object to slice.
@@ -38,20 +40,21 @@ class ucnperiod(ucnbase):
 
         stop = ucycle.cycle_param.period_end_times[period]
 
-        # copy data
-        for key, value in ucycle.__dict__.items():
-            if key == 'tfile':
-                setattr(self, key, tsubfile(value, start, stop))
-            elif key == 'epics':
-                setattr(self, key, ttreeslow(value, self))
-            elif hasattr(value, 'copy'):
-                setattr(self, key, value.copy())
-            else:
-                setattr(self, key, value)
-
-        # trim cycle parameters
-        self.cycle_param.period_durations_s = self.cycle_param.period_durations_s[period]
-        self.cycle_param.period_end_times = self.cycle_param.period_end_times[period]
+        # copy data: share everything, then replace the per-period attributes
+        self.__dict__.update(ucycle.__dict__)
+        self.tfile = tsubfile(ucycle.tfile, start, stop)
+        if 'epics' in ucycle.__dict__:
+            self.epics = ttreeslow(ucycle.epics, self)
+
+        # shallow: entries are replaced below, never modified in place,
+        # so the cycle's DataFrames needn't be duplicated for each period
+        for key in self._copy_attrs:
+            if key in ucycle.__dict__:
+                setattr(self, key, attrdict(ucycle.__dict__[key]))
+
+        # this period's values, leaving the cycle's per-period arrays in place
+        self.cycle_param.period_duration_s = float(self.cycle_param.period_durations_s[period])
+        self.cycle_param.period_end_time = float(stop)
 
         self.period = period
         self.period_start = start
@@ -68,33 +71,7 @@ class ucnperiod(ucnbase):
             str: formatted multi-column attribute listing, e.g.
                 ``"run 1846 (cycle 0, period 1):\\n  attr1  attr2  ..."``.
         """
-        klist = [d for d in self.__dict__.keys() if d[0] != '_']
-        if klist:
-
-            # sort without caps
-            klist.sort(key=lambda x: x.lower())
-
-            # get number of columns based on terminal size
-            maxsize = max((len(k) for k in klist)) + 2
-            terminal_width = os.get_terminal_size().columns
-            ncolumns = int(np.floor(terminal_width / maxsize))
-            ncolumns = min(ncolumns, len(klist))
-
-            # split into chunks
-            needed_len = int(np.ceil(len(klist) / ncolumns)*ncolumns) - len(klist)
-            klist = np.concatenate((klist, np.full(needed_len, '')))
-            klist = np.array_split(klist, ncolumns)
-
-            # print
-            cyc_str = f' (cycle {self.cycle}, period {self.period})'
-            s = f'run {self.run_number}{cyc_str}:\n'
-            for key in zip(*klist):
-                s += '  '
-                s += ''.join(['{0: <{1}}'.format(k, maxsize) for k in key])
-                s += '\n'
-            return s
-        else:
-            return self.__class__.__name__ + "()"
+        return self._format_attrs(f' (cycle {self.cycle}, period {self.period})')
 
     def is_pileup(self, detector):
         """Check if pileup may be an issue in this period.
@@ -115,21 +92,58 @@ class ucnperiod(ucnbase):
 
         # get hit timestamps as array
         t = self.get_hits_array(detector)
+        if t.size == 0:
+            return False
 
         ## filter pileup for period data
 
         # get thresholds
-        dt = ucndata.DATA_CHECK_THRESH['pileup_within_first_s']
-        count_thresh = ucndata.DATA_CHECK_THRESH['pileup_cnt_per_ms']
+        thresh = ucndata.DATA_CHECK_THRESH
+        dt = thresh['pileup_within_first_s']
+        count_thresh = thresh['pileup_cnt_per_ms']
+
+        # hits are time-sorted (get_hits_array slices the sorted run array for
+        # periods), so the first hit is t[0] and only the first dt seconds are read
+        t0 = t[0]
+        n = np.searchsorted(t, t0+dt, side='right')
 
-        # make histogram
-        counts, _ = np.histogram(t, bins=int(1/0.001*dt),
-                                        range=(min(t), min(t)+dt))
+        # no bin can hold more hits than there are in the window
+        if n <= count_thresh:
+            return False
+
+        # make histogram: count hits in each 1 ms bucket from the first hit
+        nbins = int(1/0.001*dt)
+        x = t[:n] - t0
+        x *= nbins/dt
+
+        # a hit exactly at t0+dt falls in bin nbins: count it in the last bin,
+        # as np.histogram includes the right edge of its last bin
+        idx = np.minimum(x.astype(np.int64), nbins-1)
+        counts = np.bincount(idx, minlength=nbins)
 
         # look for pileup
-        piled_up = counts > count_thresh
+        return bool(counts.max(initial=0) > count_thresh)
+
+    def are_pileup(self, detectors=None):
+        """Check if pileup may be an issue in this period for several detectors.
+
+        Applies `is_pileup` to each detector in turn.
+
+        Args:
+            detectors (iterable|None): keys to ucndata.DET_NAMES, if None check all detectors
+
+        Returns:
+            dict: detector name -> bool, true if pileup detected
+
+        Example:
+            >>> p = run[0, 0]
+            >>> p.are_pileup()
+            {'He3': False, 'Li6': False}
+        """
+        if detectors is None:
+            detectors = ucndata.DET_NAMES.keys()
 
-        return any(piled_up)
+        return {det: self.is_pileup(det) for det in detectors}
 
     def get_nhits(self, detector, bin_ms=0):
         """Get the total number of UCN hits recorded in this period.
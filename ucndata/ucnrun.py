@@ -24,6 +24,10 @@ def new_format(message, category, filename, lineno, line):
 
 warnings.formatwarning = new_format
 
+# tree keys containing any of these are not loaded, see ucnrun.keyfilter
+_REJECT_KEYS = re.compile('v1725|v1720|v792|tv1725|charge|edge_diff|'
+                          'pulse_widths|iv2|iv3|rate')
+
 class ucnrun(ucnbase):
     """UCN run data. Cleans data and performs analysis
 
@@ -151,24 +155,30 @@ class ucnrun(ucnbase):
         head = self.tfile['header'].to_dataframe()
 
         # reformat header and move to top level
-        for k, val in head.items():
-            setattr(self, k.replace(' ', '_').lower(), val.loc[0])
+        self.__dict__.update({k.replace(' ', '_').lower(): val.loc[0] for k, val in head.items()})
 
         if type(self.run_number) is pd.Series:
             self.run_number = int(float(self.run_number[0]))
         else:
             self.run_number = int(float(self.run_number))
 
-        # set other header items
-        date = pd.to_datetime(self.start_time)
+        # set other header items, from a scalar date so that these are ints
+        if type(self.start_time) is pd.Series:
+            date = pd.to_datetime(self.start_time.iloc[0])
+        else:
+            date = pd.to_datetime(self.start_time)
         self.year = date.year
         self.month = date.month
 
         # reformat tfile branch names to remove spaces
-        for key in tuple(self.tfile.keys()):
-            if ' ' in key or '-' in key:
-                self.tfile[key.replace(' ', '_').replace('-','')] = self.tfile[key]
-                del self.tfile[key]
+        renames = {key: key.replace(' ', '_').replace('-','') for key in self.tfile.keys()
+                   if ' ' in key or '-' in key}
+        for old, new in renames.items():
+            self.tfile[new] = self.tfile.pop(old)
+
+        # slow trees converted to DataFrames, see _get_tree_df
+        # (treename, columns): pd.DataFrame
+        self._tree_df = {}
 
         # set cycle parameters
         self.cycle_param = attrdict({'filter': None})
@@ -177,31 +187,41 @@ class ucnrun(ucnbase):
         if use_precise_cycles:
             self.set_cycle_times_precise(**ucndata.DEFAULT_CYCLE_TIMES_PRECISE)
 
-        # setup tree filters
-        for detector in ucndata.DET_NAMES.keys():
-            try:
-                tree = self.tfile[ucndata.DET_NAMES[detector]['hits']]
-            except KeyError:
-                continue
-
-            # purge bad timestamps
-            tree.set_filter('tUnixTimePrecise > 15e8', inplace=True)
+        # setup tree filters, for the detector trees present in the file:
+        # purge bad timestamps and filter on ucn hits, as a single expression
+        expression = 'tUnixTimePrecise > 15e8'
+        if ucn_only:
+            expression += ' && tIsUCN>0'
 
-            # filter on ucn hits
-            if ucn_only:
-                tree.set_filter('tIsUCN>0', inplace=True)
+        treenames = set(self.tfile.keys())
+        hitnames = (det['hits'] for det in ucndata.DET_NAMES.values())
+        for tree in (self.tfile[name] for name in hitnames if name in treenames):
+            tree.set_filter(expression, inplace=True)
         
         # make slow control tree
         self.epics = ttreeslow((self.tfile[name] for name in ucndata.EPICS_TREES 
-                                if name in self.tfile.keys()), parent=self)
+                                if name in treenames), parent=self)
         
-        # store fetched cycles
+        # store fetched cycles, and the list of all cycles once fetched
         self._cycledict = dict()
+        self._all_cycles = None
 
-        # store fetched histogram for binned data
-        # detector: (resolution_ms, hits rootloader.hist1d)
+        # store fetched histograms for binned data, for each resolution
+        # (detector, resolution_ms): hits rootloader.hist1d
         self._hits_hist = {}
 
+        # slow control data converted to DataFrames, see ucnbase._epics_df
+        # treename: pd.DataFrame
+        self._epics_cache = {}
+
+        # time-sorted hit times, see ucnbase._get_hits_sorted
+        # detector: hits np.ndarray
+        self._hits_sorted = {}
+
+        # hit times in integer microseconds, see ucnbase._get_hits_us
+        # detector: hits np.ndarray
+        self._hits_us = {}
+
         # histograms with edges set by period and cycle timings
         # detector: (bin_ms, hits np.ndarray)
         self._nhits = {}
@@ -209,6 +229,23 @@ class ucnrun(ucnbase):
         # pointer to self for cycles and periods
         self._run = self
 
+    def __iter__(self):
+        """Initialize iteration over cycles, respecting the cycle filter.
+
+        Returns:
+            ucnrun: self, with internal iteration counter reset to zero.
+        """
+        # setup iteration
+        super().__iter__()
+
+        # indexes of the cycles to keep, so that filtered cycles needn't be skipped one at a time
+        if self.cycle_param.filter is not None:
+            self._iter_active = np.flatnonzero(self.cycle_param.filter).tolist()
+        else:
+            self._iter_active = None
+
+        return self
+
     def __next__(self):
         """Return next cycle during iteration, respecting the cycle filter.
 
@@ -221,21 +258,18 @@ class ucnrun(ucnbase):
         """
         # permit iteration over object like it was a list
 
-        if self._iter_current < self.cycle_param.ncycles:
-
-            # skip elements that should be filtered
-            if self.cycle_param.filter is not None:
-
-                # skip
-                while not self.cycle_param.filter[self._iter_current]:
-                    self._iter_current += 1
-
-                    # end condition
-                    if self._iter_current >= self.cycle_param.ncycles:
-                        raise StopIteration()
+        # number of cycles to iterate over
+        if self._iter_active is not None:
+            nactive = len(self._iter_active)
+        else:
+            nactive = self.cycle_param.ncycles
 
-            # iterate
-            cyc = self[self._iter_current]
+        # iterate: indexes are known to be in range, skip __getitem__ checks
+        if self._iter_current < nactive:
+            if self._iter_active is not None:
+                cyc = self.get_cycle(self._iter_active[self._iter_current])
+            else:
+                cyc = self.get_cycle(self._iter_current)
             self._iter_current += 1
             return cyc
 
@@ -253,32 +287,7 @@ class ucnrun(ucnbase):
             str: multi-line string listing all public attributes, prefixed with
                 the run number.
         """
-        klist = [d for d in self.__dict__.keys() if d[0] != '_']
-        if klist:
-
-            # sort without caps
-            klist.sort(key=lambda x: x.lower())
-
-            # get number of columns based on terminal size
-            maxsize = max((len(k) for k in klist)) + 2
-            terminal_width = os.get_terminal_size().columns
-            ncolumns = int(np.floor(terminal_width / maxsize))
-            ncolumns = min(ncolumns, len(klist))
-
-            # split into chunks
-            needed_len = int(np.ceil(len(klist) / ncolumns)*ncolumns) - len(klist)
-            klist = np.concatenate((klist, np.full(needed_len, '')))
-            klist = np.array_split(klist, ncolumns)
-
-            # print
-            s = f'run {self.run_number}:\n'
-            for key in zip(*klist):
-                s += '  '
-                s += ''.join(['{0: <{1}}'.format(k, maxsize) for k in key])
-                s += '\n'
-            return s
-        else:
-            return self.__class__.__name__ + "()"
+        return self._format_attrs()
 
     def __getitem__(self, key):
         """Return cycle(s) or period(s) using index/slice notation.
@@ -338,23 +347,18 @@ class ucnrun(ucnbase):
         
         # slice on cycles
         elif isinstance(key, (slice, np.ndarray, list, tuple, applylist)):
-            cycles = self.get_cycle()[:self.cycle_param.ncycles]
-
-            # no filter
-            if self.cycle_param.filter is None or all(self.cycle_param.filter):
-                cyc = cycles[key]
 
-            # yes filter
-            else:
-
-                # fetch the filter and slice in the same way as the return value
-                cfilter = self.cycle_param.filter[key]
+            # slice the cycle numbers rather than the cycles, so that only the
+            # requested cycles are built
+            if not isinstance(key, slice):
+                key = np.asarray(key)
+            idx = np.arange(self.cycle_param.ncycles)[key]
 
-                # fetch cycles and slice, then apply filter
-                cyc = cycles[key]
-                cyc = cyc[cfilter]
+            # fetch the filter and slice in the same way as the return value
+            if self.cycle_param.filter is not None:
+                idx = idx[self.cycle_param.filter[key]]
 
-            return applylist(cyc)
+            return applylist(map(self.get_cycle, idx.tolist()))
 
         raise IndexError(f'Run {self.run_number} given an unknown index type ({type(key)})')
 
@@ -377,15 +381,12 @@ class ucnrun(ucnbase):
 
         # Notes:
         #     Because of how RDataFrame works it is better to compute a histogram whose bins correspond to the period or cycle start/end times than to set a filter and get the resulting tree size.
-        #     The histogram bin quantities is saved as self._nhits
+        #     The histogram bin quantities is saved as self._nhits, as (bin_ms, hits[cycle, period], hits per cycle)
         #     Both ucncycle and ucnperiod classes call this function to get the counts
 
-        # get hits tree
-        tree = self.tfile[ucndata.DET_NAMES[detector]['hits']]
-
         # get hits for run
         if cycle is None and period is None:
-            return tree.size
+            return self.tfile[ucndata.DET_NAMES[detector]['hits']].size
 
         # check _nhits bin_ms to see if we need to regenerate the histogram
         if detector in self._nhits.keys() and self._nhits[detector][0] != bin_ms:
@@ -398,26 +399,21 @@ class ucnrun(ucnbase):
         # make hits histogram for periods and cycles
         elif detector not in self._nhits.keys():
 
-            # use period and cycle start and end times as bin edges for _nhits
-            edges = []
-            for cyclei in range(self.cycle_param.ncycles):
-
-                cycle_start = self.cycle_param.cycle_times.start[cyclei].copy()
-                period_ends = self.cycle_param.period_end_times[cyclei].copy()
+            # get hits tree
+            tree = self.tfile[ucndata.DET_NAMES[detector]['hits']]
 
-                # shorten periods that extend past the end of the cycle (edge case)
-                if cyclei < self.cycle_param.ncycles-1:
-                    next_cycle_start = self.cycle_param.cycle_times.start[cyclei+1]
-                else:
-                    next_cycle_start = self.cycle_param.cycle_times.stop.iloc[-1]
-
-                period_ends[period_ends > next_cycle_start] = next_cycle_start
+            # use period and cycle start and end times as bin edges for _nhits
+            cycle_starts = self.cycle_param.cycle_times.start.to_numpy()
+            run_stop = self.cycle_param.cycle_times.stop.iloc[-1]
+            period_ends = self.cycle_param.period_end_times.to_numpy() # [period, cycle]
 
-                # save to list
-                edges.append(cycle_start)
-                edges.extend(list(period_ends))
+            # shorten periods that extend past the end of the cycle (edge case)
+            next_cycle_starts = np.append(cycle_starts[1:], run_stop)
+            period_ends = np.minimum(period_ends, next_cycle_starts)
 
-            edges = np.append(edges, self.cycle_param.cycle_times.stop.iloc[-1])
+            # cycle start then its period ends, for each cycle
+            edges = np.concatenate((cycle_starts[:, np.newaxis], period_ends.T), axis=1)
+            edges = np.append(edges.ravel(), run_stop)
 
             # discard duplicate edges - this drop counts for zero length periods, 
             # we re-insert these after
@@ -426,16 +422,14 @@ class ucnrun(ucnbase):
             # use resolution tree to generate the hits histogram
             if bin_ms > 0:
 
-                # check if hits histogram exists and has the correct information
-                if detector in self._hits_hist.keys() and \
-                    self._hits_hist[detector][0] == bin_ms:
-                    hist = self._hits_hist[detector][1]
+                # check if hits histogram exists for this resolution
+                if (detector, bin_ms) in self._hits_hist.keys():
+                    hist = self._hits_hist[(detector, bin_ms)]
 
                 # generate the hits histogram from binned data
                 else:
-                    tree = self.tfile[ucndata.DET_NAMES[detector]['hits']]
                     hist = tree.hist1d('tUnixTimePrecise', step=bin_ms/1000)
-                    self._hits_hist[detector] = (bin_ms, hist)
+                    self._hits_hist[(detector, bin_ms)] = hist
 
                 # make _nhits histogram based on _hits_hist histogram
                 times = hist.x
@@ -468,22 +462,26 @@ class ucnrun(ucnbase):
                     else:
                         nhits.append(0)
                     
-                # end of cycle hits after last period
+                # end of cycle hits after last period, zero if the run ended
+                # first so that every cycle has the same number of entries
                 if idx < len(hits):
                     nhits.append(hits[idx])
                     idx += 1
+                else:
+                    nhits.append(0)
 
-            # convert to np array and save as tuple
-            self._nhits[detector] = (bin_ms, np.array(nhits))
+            # save as nhits[cycle, period], the last column being hits after the
+            # last period, along with the total for each cycle
+            nhits = np.reshape(nhits, (dur.shape[0], dur.shape[1]+1))
+            self._nhits[detector] = (bin_ms, nhits, nhits.sum(axis=1))
 
         # get hits for cycle
         if period is None:
-            nperiodsp1 = len(self.cycle_param.period_end_times)+1
-            return int(self._nhits[detector][1][cycle*nperiodsp1:(cycle+1)*nperiodsp1].sum())
+            return int(self._nhits[detector][2][cycle])
 
         # get hits for period
         else:
-            return int(self._nhits[detector][1][cycle*(len(self.cycle_param.period_end_times)+1)+period])
+            return int(self._nhits[detector][1][cycle, period])
 
     def _modify_ptiming(self, cycle, period, dt_start_s=0, dt_stop_s=0, update_duration=True):
         # Change start and end times of periods
@@ -504,46 +502,38 @@ class ucnrun(ucnbase):
         # get cycle parameters
         cycpar = self.cycle_param
 
-        # start times - prevent unnecessary recursion
+        # durations before the change, to find adjacent size zero periods
+        durs = cycpar.period_durations_s[cycle].to_numpy()
+
+        # start times
         if dt_start_s != 0:
 
             # adjust cycle start
             if period == 0:
                 cycpar.cycle_times.loc[cycle, 'start'] += dt_start_s
 
-            # period start time adjustment
+            # period start time adjustment, moving along with it the adjacent
+            # size zero periods before this one (but not the cycle start)
             else:
-                cycpar.period_end_times.loc[period-1, cycle] += dt_start_s
+                first = period
+                while first-1 > 0 and durs[first-1] == 0:
+                    first -= 1
+                cycpar.period_end_times.loc[first-1:period-1, cycle] += dt_start_s
 
-            # recursively adjust adjacent size zero periods
-            if period-1 > 0 and cycpar.period_durations_s.loc[period-1, cycle] == 0:
-                self._modify_ptiming(cycle, period-1,
-                                    dt_start_s = dt_start_s,
-                                    dt_stop_s  = 0,
-                                    update_duration = False)
-
-        # stop times - prevent unnecessary recursion
+        # stop times
         if dt_stop_s != 0:
 
-            # period end time adjustment
-            cycpar.period_end_times.loc[period, cycle] += dt_stop_s
+            # period end time adjustment, moving along with it the adjacent
+            # size zero periods after this one
+            last = period
+            while last+1 < len(durs) and durs[last+1] == 0:
+                last += 1
+            cycpar.period_end_times.loc[period:last, cycle] += dt_stop_s
 
             # force periods to stay within cycle bounds
             cycend = cycpar.cycle_times.loc[cycle, 'stop']
-            perend = cycpar.period_end_times.loc[period, cycle]
-            cycpar.period_end_times.loc[period, cycle] = min(perend, cycend)
-
-            # recursively adjust adjacent size zero periods
-            try:
-                if cycpar.period_durations_s.loc[period+1, cycle] == 0:
-                    self._modify_ptiming(cycle, period+1,
-                                        dt_start_s = 0,
-                                        dt_stop_s  = dt_stop_s,
-                                        update_duration = False)
-
-            # period not in durations dataframe
-            except KeyError:
-                pass
+            perend = cycpar.period_end_times.loc[period:last, cycle]
+            cycpar.period_end_times.loc[period:last, cycle] = perend.clip(upper=cycend)
 
         # adjust period and cycle durations
         if update_duration:
@@ -551,10 +541,12 @@ class ucnrun(ucnbase):
             start = cycpar.cycle_times['start']
             stop = cycpar.cycle_times['stop']
 
+            # difference between successive period ends, the first period
+            # starting at the cycle start
             df = cycpar.period_end_times
-            df_diff = df.diff()
-            df_diff.loc[0] = df.loc[0] - start
-            cycpar.period_durations_s = df_diff
+            cycstart = start.reindex(df.columns).to_numpy()
+            dur = np.diff(df.to_numpy(), axis=0, prepend=cycstart[np.newaxis, :])
+            cycpar.period_durations_s = pd.DataFrame(dur, index=df.index, columns=df.columns)
 
             cycpar.cycle_times.loc[cycle, 'duration (s)'] = (stop-start).loc[0]
 
@@ -564,10 +556,38 @@ class ucnrun(ucnbase):
         # remove saved cycles to account for updated limits
         if cycle in self._cycledict.keys():
             del self._cycledict[cycle]
+        self._all_cycles = None
 
         # reset histogram for number of hits
         self._nhits = {}
 
+        # reset cached cycle start times
+        self._cycle_times_arr = None
+
+    def _get_tree_df(self, treename, columns=None):
+        # Get a tree from tfile as a DataFrame
+
+        # Args:
+        #     treename (str): name of the tree in self.tfile
+        #     columns (tuple|None): branches to convert, if None convert all
+
+        # Notes:
+        #     Cached per (treename, columns) in self._tree_df on first access, so
+        #     that the cycle time setters, which each re-derive the cycle and
+        #     period timing, convert the trees only once per run
+
+        key = (treename, columns)
+        if key not in self._tree_df.keys():
+            df = self.tfile[treename]
+            if columns is not None:
+                df = df[list(columns)]
+            if isinstance(df, ttree):
+                df = df.to_dataframe()
+            if isinstance(df, pd.Series):
+                df = df.to_frame()
+            self._tree_df[key] = df
+        return self._tree_df[key]
+
     def _set_valve_states(self):
         """Read valve-state columns from `CycleParamTree` and store in `cycle_param`.
 
@@ -576,26 +596,15 @@ class ucnrun(ucnbase):
         in ``self.cycle_param['valve_states']`` with axes named 'period' (rows)
         and 'valve' (columns).
         """
-        # get full tree as dataframe
-        df = self.tfile.CycleParamTree
-        if isinstance(df, ttree):
-            df = df.to_dataframe()
-
         # select valve-state columns (names must contain 'Valve', capital V)
-        valve_cols = [col for col in df.columns if 'Valve' in col]
-        df = df[valve_cols]
+        df = self._get_tree_df('CycleParamTree')
+        cols = df.columns[df.columns.str.contains('Valve')]
+        valves = cols.str.replace(r'\D', '', regex=True).astype(int)
 
-        # ensure result is always a DataFrame (single column selects as Series)
-        if isinstance(df, pd.Series):
-            df = df.to_frame()
-
-        col_map = {col: int(re.sub(r'\D', '', col)) for col in df.columns}
-        df = df.rename(columns=col_map)
-        df.reset_index(inplace=True, drop=True)
-        df.columns.name = 'valve'
-        df.index.name = 'period'
-
-        self.cycle_param['valve_states'] = df
+        # one contiguous block, labelled in the constructor
+        self.cycle_param['valve_states'] = pd.DataFrame(df[cols].to_numpy(),
+                                    index=pd.RangeIndex(len(df), name='period'),
+                                    columns=pd.Index(valves, name='valve'))
 
     def _set_period_times(self):
         """Compute and store period durations and end times from `CycleParamTree`.
@@ -619,18 +628,15 @@ class ucnrun(ucnbase):
         """
 
         # get tree as dataframe
-        dur = self.tfile.CycleParamTree
-        dur = dur[[col for col in dur.columns if 'Duration' in col]]
-        
-        if isinstance(dur, ttree):
-            dur = dur.to_dataframe()
+        tree = self._get_tree_df('CycleParamTree')
+        dur = tree[[col for col in tree.columns if 'Duration' in col]]
 
         # get period durations ----------------------------------------------
-        dur = dur.rename(columns={col:int(re.sub(r'\D', '', col)) for col in dur.columns})
+        dur.columns = dur.columns.str.replace(r'\D', '', regex=True).astype(int)
         dur = dur.reindex(sorted(dur.columns), axis=1)
         
         # drop all columns after nCycles
-        ncycles_per_supercycle = self.tfile.CycleParamTree.nCycles.values[0] 
+        ncycles_per_supercycle = tree.nCycles.values[0] 
         dur = dur[[col for col in dur.columns if col < ncycles_per_supercycle]]  
 
         # drop all rows after nPeriods
@@ -640,9 +646,8 @@ class ucnrun(ucnbase):
         # expand for all cycles
         cycleids = self.cycle_param.cycle_times.index.values
         ncycles = len(cycleids)
-        dur = pd.concat([dur]*int(np.ceil(ncycles / len(dur.columns))),
-                       axis='columns')
-        dur.columns = np.arange(len(dur.columns))
+        ntile = int(np.ceil(ncycles / len(dur.columns)))
+        dur = pd.DataFrame(np.tile(dur.to_numpy(), (1, ntile)), index=dur.index)
         
         # trim missing cycles
         dur = dur[self.cycle_param.cycle_times.index]
@@ -655,22 +660,21 @@ class ucnrun(ucnbase):
         # get cycle start times
         start = self.cycle_param.cycle_times.start.values
 
-        # sum
-        ends = dur.cumsum()
-        for i, st in enumerate(start):
-            ends.loc[:, i] += st
+        # sum, offset each cycle (column) by its start time
+        ends = dur.cumsum() + start
 
         # update cycle_param
         self.cycle_param['period_end_times'] = ends
         self.cycle_param['nperiods'] = len(ends.index)
-        self.cycle_param.cycle_times['supercycle'] = cycleids // ncycles_per_supercycle
+        supercycle = cycleids // ncycles_per_supercycle
+        self.cycle_param.cycle_times['supercycle'] = supercycle
         
         self.cycle_param['cycle'] = cycleids % ncycles_per_supercycle
         self.cycle_param['supercycle'] = self.cycle_param.cycle_times['supercycle']
         self.cycle_param['ncycles_per_supercycle'] = ncycles_per_supercycle
         self.cycle_param['ncycles'] = len(cycleids)
         # self.cycle_param['nperiods'] = nperiods
-        self.cycle_param['nsupercycles'] = len(self.cycle_param.cycle_times.supercycle.unique())
+        self.cycle_param['nsupercycles'] = np.unique(supercycle).size
 
     def check_data(self, raise_error=False):
         """Run some checks to determine if the data is ok.
@@ -713,16 +717,23 @@ class ucnrun(ucnbase):
                     print(msg)
                     return False
 
+        # sequencer state is the same for all detectors: look it up at most once
+        sequencer_enabled = None
+
         for name, det in ucndata.DET_NAMES.items():
 
             # check for nonzero counts
-            if not self.tfile[det['hits']].tIsUCN.any():
+            if not self.tfile[det['hits']].tIsUCN.values.any():
                 msg = f'No UCN hits in "{name}" ttree in run {self.run_number}'
 
             # check if sequencer was enabled but no run transitions
-            elif any(self.tfile.SequencerTree.sequencerEnabled):
+            else:
+                # count entries on the C++ side rather than reading the branch
+                if sequencer_enabled is None:
+                    seqtree = self.tfile.SequencerTree.set_filter('sequencerEnabled != 0')
+                    sequencer_enabled = seqtree.size > 0
 
-                if len(self.tfile[det['transitions']]) == 0:
+                if sequencer_enabled and len(self.tfile[det['transitions']]) == 0:
                     msg = f'No cycles found in run {self.run_number}, although sequencer was active'
 
             # raise error or return
@@ -745,7 +756,9 @@ class ucnrun(ucnbase):
             `np.array(bool)`: `True` if keep cycle, `False` if discard
 
         Notes:
-            Calls `ucncycle.check_data` on each cycle
+            Calls `ucncycle.check_data` on each cycle. The cycles are checked
+            serially: each check slices the run-level beam current cache, which
+            is filled here before the scan, so the per-cycle work is small.
 
         Example:
             >>> run = ucnrun(2575)
@@ -757,12 +770,17 @@ class ucnrun(ucnbase):
             >>> run.set_cycle_filter(run.gen_cycle_filter(quiet=True))
         """
 
-        cycles = self.get_cycle()
+        # convert the beam current once, shared by all cycle checks
+        self._load_epics()
+
+        # fetch cycles as they are checked, rather than building them all up front
+        ncycles = self.cycle_param.ncycles
+        cycles = map(self.get_cycle, range(ncycles))
         iterator = tqdm(cycles, desc=f'Run {self.run_number}: Scanning cycles',
                                 leave=False,
-                                total=self.cycle_param.ncycles)
-        cfilter = [c.check_data(quiet=quiet, raise_error=False) for c in iterator]
-        return np.array(cfilter)
+                                total=ncycles)
+        return np.fromiter((c.check_data(quiet=quiet, raise_error=False) for c in iterator),
+                           dtype=bool, count=ncycles)
 
     def get_cycle(self, cycle=None):
         """Return a copy of this object, but trees are trimmed to only one cycle.
@@ -783,8 +801,12 @@ class ucnrun(ucnbase):
         """
 
         if cycle is None or cycle < 0:
-            ncycles = len(self.cycle_param.cycle_times.index)
-            return applylist(map(self.get_cycle, range(ncycles)))
+            if self._all_cycles is None:
+                ncycles = self.cycle_param.ncycles
+                self._all_cycles = applylist(map(self.get_cycle, range(ncycles)))
+
+            # copy so that callers may modify the list
+            return applylist(self._all_cycles)
         elif cycle in self._cycledict.keys():
             return self._cycledict[cycle]
         else:
@@ -808,14 +830,8 @@ class ucnrun(ucnbase):
 
         name = name.replace(' ', '_').lower()
 
-        # reject some keys based on partial matches
-        reject_keys = ('v1725', 'v1720', 'v792', 'tv1725', 'charge', 'edge_diff',
-                       'pulse_widths', 'iv2', 'iv3', 'rate')
-        for key in reject_keys:
-            if key in name:
-                return False
-
-        return True
+        # reject some keys based on partial matches, in a single scan
+        return _REJECT_KEYS.search(name) is None
 
     def set_cycle_filter(self, cfilter=None):
         """Set filter for which cycles to fetch when slicing or iterating
@@ -855,7 +871,7 @@ class ucnrun(ucnbase):
         """
 
         # check input
-        cfilter = np.array(cfilter).astype(bool)
+        cfilter = np.array(cfilter, dtype=bool)
 
         if len(cfilter) != self.cycle_param.ncycles:
             raise RuntimeError(f'Run {self.run_number}: Length of cycle filter ({len(cfilter)}) does not match expected number of cycles ({self.cycle_param.ncycles})')
@@ -863,9 +879,10 @@ class ucnrun(ucnbase):
         # set
         self.cycle_param.filter = cfilter
 
-        # set for already fetched cycles
+        # set for already fetched cycles, as python bools like ucncycle
+        cfilter = cfilter.tolist()
         for key, cyc in self._cycledict.items():
-            cyc.cycle_param.filter = self.cycle_param.filter[key]
+            cyc.cycle_param.filter = cfilter[key]
 
     def set_cycle_times_crude(self):
         """Get start and end times of each cycle from the sequencer and save
@@ -893,9 +910,10 @@ class ucnrun(ucnbase):
             raise DataError('Missing SequencerTree. Cannot set crude cycle times')
         
         # get cycle start times from sequencer tree
-        tree = self.tfile.SequencerTree.set_filter('cycleStarted != 0')
-        start = tree.timestamp.values.astype(float)
-        run_stop = self.tfile.SequencerTree.timestamp.max()
+        seq = self._get_tree_df('SequencerTree', ('cycleStarted',))
+        timestamp = seq.index.to_numpy(dtype=float)
+        start = timestamp[seq['cycleStarted'].to_numpy() != 0]
+        run_stop = timestamp.max()
 
         # get run durations
         duration = np.diff(np.concatenate((start, [run_stop])))
@@ -915,8 +933,10 @@ class ucnrun(ucnbase):
         # update period times
         self._set_period_times()
 
-        # reset cycle dict
+        # reset cycle dict and cached cycle start times
         self._cycledict = {}
+        self._all_cycles = None
+        self._cycle_times_arr = None
 
     def set_cycle_times_precise(self, hw_channel=10, detector='Li6'):
         """Replace crude cycle start times with hardware-timestamped precise times.
@@ -974,14 +994,15 @@ class ucnrun(ucnbase):
         ctimes = self.cycle_param.cycle_times.start.values
 
         # get the detector transition tree times, hopefully they are precise times (will check later)
-        if f'RunTransitions_{detector}' not in self.tfile.keys():
-            raise KeyError(f'RunTransitions_{detector} not found in tfile')
+        treename = f'RunTransitions_{detector}'
+        if treename not in self.tfile.keys():
+            raise KeyError(f'{treename} not found in tfile')
 
-        tree = self.tfile[f'RunTransitions_{detector}']
-        ptimes = np.sort(tree.cycleStartTime.to_array())
+        tree = self._get_tree_df(treename, ('cycleStartTime',))
+        ptimes = np.sort(tree['cycleStartTime'].to_numpy())
 
         # run transitions are crude times: find the times from the hit tree
-        if len(ptimes) == len(ctimes) and all(ptimes == ctimes):
+        if np.array_equal(ptimes, ctimes):
             tree = self.tfile[ucndata.DET_NAMES[detector]['hits']].reset()
             tree.set_filter(f'tChannel == {hw_channel}', inplace=True)
             ptimes = tree.tUnixTimePrecise.to_array()
@@ -1010,10 +1031,6 @@ class ucnrun(ucnbase):
             return
         pdur = np.mean(per_cycle)
 
-        # setup new values
-        new_times = []
-        is_measured = []
-
         # check that the first precise timestamp was recorded, if not back-extrapolate.
         # Only prepend if ptimes[0] is AFTER ctimes[0] (missed leading trigger); if
         # ptimes[0] is before ctimes[0] by more than pdur/2, the grid is misaligned and
@@ -1021,50 +1038,40 @@ class ucnrun(ucnbase):
         npre_cycles = 0
         if ptimes[0] > ctimes[0] + pdur/2:
             npre_cycles = int(np.round((ptimes[0] - ctimes[0])/pdur))
-            is_measured = [False] * npre_cycles
-            new_times = [ptimes[0] - pdur * i for i in range(npre_cycles, 0, -1)]
-
-        # get additional number of cycles to insert
-        ncycles = np.round(diff/pdur) - 1 
-
-        # interpolate missing values
-        i = -1
-        for i, n in enumerate(ncycles):
-            t = ptimes[i]
-            new_times.append(t)
-            is_measured.append(True)
-
-            while n > 0:
-                t += pdur
-                new_times.append(t)
-                is_measured.append(False)
-                n -= 1
-                
-        if len(ptimes) > i+1:
-            new_times.append(ptimes[i+1])
-            is_measured.append(True)
+        pre_times = ptimes[0] - pdur * np.arange(npre_cycles, 0, -1)
+
+        # get additional number of cycles to insert after each measured time
+        ncycles = np.maximum(np.round(diff/pdur) - 1, 0).astype(int)
+
+        # interpolate missing values: each measured time is followed by
+        # ncycles evenly spaced unmeasured times
+        nrep = ncycles + 1
+        offset = np.arange(nrep.sum()) - np.repeat(np.cumsum(nrep) - nrep, nrep)
+        interp_times = np.repeat(ptimes[:-1], nrep) + offset*pdur
+
+        new_times = np.concatenate((pre_times, interp_times, ptimes[-1:]))
+        is_measured = np.concatenate((np.zeros(npre_cycles, dtype=bool),
+                                      offset == 0,
+                                      [True]))
 
         # forward-extrapolate for any cycles after the last hardware trigger,
         # or trim if the reconstruction overshot (e.g. due to spurious double hits).
         n_target = len(ctimes)
-        t = new_times[-1]
-        while len(new_times) < n_target:
-            t += pdur
-            new_times.append(t)
-            is_measured.append(False)
+        nextra = max(n_target - len(new_times), 0)
+        new_times = np.concatenate((new_times, new_times[-1] + pdur*np.arange(1, nextra+1)))
+        is_measured = np.concatenate((is_measured, np.zeros(nextra, dtype=bool)))
         new_times = new_times[:n_target]
         is_measured = is_measured[:n_target]
 
         # add run stop time
-        run_stop = self.tfile.SequencerTree.timestamp.max()
+        run_stop = self._get_tree_df('SequencerTree', ('cycleStarted',)).index.max()
         durations = np.concat((np.diff(new_times), [run_stop - new_times[-1]]))
 
         # setup cycle times
-        cycle_times = self.cycle_param.cycle_times.copy()
-        cycle_times['is_measured'] = is_measured
-        cycle_times['duration (s)'] = durations
-        cycle_times['start'] = new_times
-        cycle_times['stop'] = np.array(new_times) + durations
+        cycle_times = self.cycle_param.cycle_times.assign(**{'is_measured': is_measured,
+                                                             'duration (s)': durations,
+                                                             'start': new_times,
+                                                             'stop': new_times + durations})
 
         # copy dicts
         self.cycle_param.cycle_times = cycle_times
@@ -1073,5 +1080,7 @@ class ucnrun(ucnbase):
         # update period timings
         self._set_period_times()
         
-        # reset cycle dict
+        # reset cycle dict and cached cycle start times
         self._cycledict = {}
+        self._all_cycles = None
+        self._cycle_times_arr = None